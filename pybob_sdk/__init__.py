@@ -1 +1,21 @@
-from .bob import Bob
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bob import Bob
+    from .async_bob import AsyncBob
+
+__all__ = ["Bob", "AsyncBob"]
+
+# Imported on first access, so `import pybob_sdk` does not pay for unused clients.
+_LAZY = {"Bob": ".bob", "AsyncBob": ".async_bob"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
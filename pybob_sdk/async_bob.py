@@ -0,0 +1,63 @@
+from .bob import Bob
+from .async_bob_client import AsyncBobClient
+from .retry import RetryPolicy
+from .codec import JSONCodec
+from typing import Optional
+
+
+class AsyncBob(Bob):
+    def __init__(
+        self,
+        service_account_id: str,
+        service_account_token: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        retry: Optional[RetryPolicy] = None,
+        cache=None,
+        etag_cache=None,
+        codec: Optional[JSONCodec] = None,
+    ):
+        """
+        asyncio facade over the v1 endpoints.
+
+        Exposes the same endpoints as Bob, but every API method returns a coroutine. All
+        endpoints share one AsyncBobClient connection pool, so many requests can run
+        concurrently from a single event loop:
+
+            async with AsyncBob(service_account_id, service_account_token) as bob:
+                salaries = await asyncio.gather(
+                    *(bob.people.employee.list_salary_history(id) for id in ids)
+                )
+
+        Helpers built on threads or streamed responses (search_iter, directory,
+        bulk_history, download_to, iter_csv, download_async, whos_out_cache, change_feed,
+        batch_submitter, bulk_balances, import_in_chunks, import_from_file, bulk_upload,
+        export_documents and dedupe_index) need Bob and raise TypeError here.
+        """
+        self.client = AsyncBobClient(
+            service_account_id=service_account_id,
+            service_account_token=service_account_token,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            retry=retry,
+            cache=cache,
+            etag_cache=etag_cache,
+            codec=codec,
+        )
+
+    async def close(self):
+        """
+        Close the underlying HTTP session shared by all endpoints.
+        """
+        await self.client.close()
+
+    def __enter__(self):
+        raise TypeError("AsyncBob must be used with `async with`")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,312 @@
+import asyncio
+import logging
+from typing import Optional
+from .bob_client import BobClient, rewind
+from .retry import RetryPolicy, RetryStats
+from .cache import MISSING, TTLCache, cache_key, conditional_headers
+from .codec import JSONCodec, default_codec
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+log = logging.getLogger("py-bob")
+
+
+class AsyncFileBody:
+    def __init__(self, file, chunk_size: int = 1 << 16):
+        """
+        Async iterable over a binary file-like request body, e.g. a MultipartFile.
+
+        Every iteration starts from the beginning of the file, so a retried request
+        resends it in full.
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        self.file.seek(0)
+
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+
+
+class AsyncBobClient:
+    def __init__(
+        self,
+        service_account_id: str,
+        service_account_token: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        retry: Optional[RetryPolicy] = None,
+        cache=None,
+        etag_cache=None,
+        codec: Optional[JSONCodec] = None,
+    ):
+        """
+        asyncio counterpart of BobClient backed by a single pooled httpx.AsyncClient.
+
+        The get/post/put/delete methods mirror BobClient but return coroutines, so every v1
+        endpoint can be driven from an event loop with its calls awaited.
+
+        Args:
+            service_account_id (str): Bob service account ID.
+            service_account_token (str): Bob service account token.
+            max_connections (int, optional): Maximum number of concurrent connections. Default is 100.
+            max_keepalive_connections (int, optional): Maximum number of idle connections kept open. Default is 20.
+            keepalive_expiry (float, optional): Seconds an idle connection is kept open. Default is 5.0.
+            retry (RetryPolicy, optional): Retry and backoff policy for throttled or failed requests. Defaults to RetryPolicy().
+            cache (TTLCache, optional): Cache used by read-only metadata calls. Defaults to TTLCache(), SQLiteCache keeps entries on disk.
+            etag_cache (TTLCache, optional): Responses kept for ETag/Last-Modified revalidation of GET requests. Defaults to TTLCache(maxsize=64, ttl=inf, copy_values=False), maxsize=0 disables it.
+            codec (JSONCodec, optional): JSON encoder/decoder of request and response bodies. Defaults to orjson or msgspec when installed, json otherwise.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncBobClient requires httpx, install it with `pip install pybob-sdk[async]`"
+            )
+
+        self.api = "https://api.hibob.com/v1/"
+        self.timeout = 30
+        self.service_account_id = service_account_id
+        self.service_account_token = service_account_token
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.cache = cache if cache is not None else TTLCache()
+        self.etag_cache = (
+            etag_cache
+            if etag_cache is not None
+            else TTLCache(maxsize=64, ttl=float("inf"), copy_values=False)
+        )
+        self.codec = codec if codec is not None else default_codec()
+        self.session = httpx.AsyncClient(
+            auth=httpx.BasicAuth(service_account_id, service_account_token),
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def close(self):
+        """
+        Close the pooled session and release its connections.
+        """
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    parse_response = BobClient.parse_response
+
+    @staticmethod
+    async def then(response, callback):
+        return callback(await response)
+
+    async def make_request(
+        self,
+        method,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
+        request_params = {
+            "params": (
+                {key: value for key, value in query.items() if value is not None}
+                if query
+                else None
+            ),
+            "files": files,
+            "headers": dict(headers or {}),
+            "timeout": timeout if timeout is not None else self.timeout,
+        }
+
+        if json_body is not None and body is None and not files:
+            request_params["content"] = self.codec.dumps(json_body)
+            request_params["headers"].setdefault("Content-Type", "application/json")
+        elif isinstance(body, (str, bytes)):
+            request_params["content"] = body
+        elif hasattr(body, "read"):
+            request_params["content"] = AsyncFileBody(body)
+            if hasattr(body, "__len__"):
+                request_params["headers"]["Content-Length"] = str(len(body))
+        else:
+            request_params["data"] = body
+            request_params["json"] = json_body
+
+        key, cached = None, MISSING
+
+        if method == "GET":
+            key = cache_key(endpoint, query, json_body)
+            cached = self.etag_cache.get(key)
+            if cached is not MISSING:
+                request_params["headers"].update(conditional_headers(cached))
+
+        endpoint = self.api + endpoint
+
+        response = await self.send(method, endpoint, **request_params)
+
+        if response.status_code == 304 and cached is not MISSING:
+            log.debug(f"{endpoint} not modified, returning revalidated response")
+            response = cached
+        elif key and response.status_code == 200 and conditional_headers(response):
+            self.etag_cache.set(key, response)
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            log.exception(error)
+            log.debug(response)
+            raise error
+
+        return self.parse_response(response)
+
+    async def request_headers(self, method, endpoint, query=None):
+        """
+        Send a request and return its response headers, see BobClient.request_headers.
+        """
+        response = await self.send(
+            method,
+            self.api + endpoint,
+            params=(
+                {key: value for key, value in query.items() if value is not None}
+                if query
+                else None
+            ),
+            timeout=self.timeout,
+        )
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            log.exception(error)
+            log.debug(response)
+            raise error
+
+        return response.headers
+
+    async def send(self, method, url, **request_params):
+        """
+        Send a request through the pooled session, retrying according to self.retry.
+        """
+        attempt = 0
+
+        while True:
+            try:
+                response = await self.session.request(method, url, **request_params)
+            except httpx.TransportError as error:
+                if not self.retry.should_retry(method, None, attempt):
+                    raise error
+                delay = self.retry.get_delay(attempt)
+                log.warning(
+                    f"{method} {url} failed ({error}), retrying in {delay:.2f}s"
+                )
+            else:
+                if response.is_success or not self.retry.should_retry(
+                    method, response.status_code, attempt
+                ):
+                    return response
+                delay = self.retry.get_delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+                log.warning(
+                    f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s"
+                )
+                await response.aclose()
+
+            self.retry_stats.record(delay)
+            await asyncio.sleep(delay)
+            rewind(request_params.get("files"), request_params.get("data"))
+            attempt += 1
+
+    async def get(self, endpoint, query=None, json_body=None, body=None, cache=False):
+        if not cache:
+            return await self.make_request(
+                "GET", endpoint, query=query, json_body=json_body, body=body
+            )
+
+        key = cache_key(endpoint, query, json_body)
+        response = self.cache.get(key)
+
+        if response is MISSING:
+            response = await self.make_request(
+                "GET", endpoint, query=query, json_body=json_body, body=body
+            )
+            if isinstance(response, (dict, list, str)):
+                self.cache.set(key, response)
+
+        return response
+
+    invalidate_after = BobClient.invalidate_after
+
+    async def post(
+        self,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
+        return await self.make_request(
+            "POST",
+            endpoint,
+            json_body=json_body,
+            query=query,
+            body=body,
+            files=files,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    async def put(
+        self,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
+        return await self.make_request(
+            "PUT",
+            endpoint,
+            json_body=json_body,
+            query=query,
+            body=body,
+            files=files,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    async def delete(
+        self,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
+        return await self.make_request(
+            "DELETE",
+            endpoint,
+            json_body=json_body,
+            query=query,
+            body=body,
+            files=files,
+            headers=headers,
+            timeout=timeout,
+        )
@@ -1,28 +1,59 @@
 from .bob_client import BobClient
-from .v1 import (
-    people,
-    onboarding,
-    reports,
-    tasks,
-    metadata,
-    timeoff,
-    attendance,
-    payroll,
-    documents,
-    hiring,
-    tables,
-    objects,
-)
+from .retry import RetryPolicy
+from .limiter import RequestScheduler
+from functools import cached_property
+from .codec import JSONCodec
+from typing import Optional
 
 
 class Bob:
-    def __init__(self, service_account_id: str, service_account_token: str):
+    def __init__(
+        self,
+        service_account_id: str,
+        service_account_token: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        cache=None,
+        etag_cache=None,
+        codec: Optional[JSONCodec] = None,
+    ):
         self.client = BobClient(
             service_account_id=service_account_id,
             service_account_token=service_account_token,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            retry=retry,
+            scheduler=scheduler,
+            cache=cache,
+            etag_cache=etag_cache,
+            codec=codec,
         )
 
-    @property
+    def close(self):
+        """
+        Close the underlying HTTP session shared by all endpoints and stop the report
+        poller of download_async.
+        """
+        from .v1.report_jobs import ReportPoller
+
+        ReportPoller.close_for_client(self.client)
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Endpoints are created on first access and then reused, so endpoint state lives as
+    # long as the Bob instance and hot loops do not rebuild them on every access. Their
+    # modules are imported on first access too, keeping `import pybob_sdk` cheap.
+
+    @cached_property
     def people(self):
         """
         This class represents the People endpoint of the Bob API.
@@ -37,48 +68,72 @@ class Bob:
         ):
         This API returns a list of requested employees with requested fields. The data is filtered based on the requested fields and access level of the provided credentials. Only viewable categories are returned.
         """
+        from .v1 import people
+
         return people.People(self.client)
 
-    @property
+    @cached_property
     def onboarding(self):
+        from .v1 import onboarding
+
         return onboarding.Onboarding(self.client)
 
-    @property
+    @cached_property
     def reports(self):
+        from .v1 import reports
+
         return reports.Reports(self.client)
 
-    @property
+    @cached_property
     def tasks(self):
+        from .v1 import tasks
+
         return tasks.Tasks(self.client)
 
-    @property
+    @cached_property
     def metadata(self):
+        from .v1 import metadata
+
         return metadata.Metadata(self.client)
 
-    @property
+    @cached_property
     def time_off(self):
+        from .v1 import timeoff
+
         return timeoff.TimeOff(self.client)
 
-    @property
+    @cached_property
     def attendance(self):
+        from .v1 import attendance
+
         return attendance.Attendance(self.client)
 
-    @property
+    @cached_property
     def payroll(self):
+        from .v1 import payroll
+
         return payroll.Payroll(self.client)
 
-    @property
+    @cached_property
     def documents(self):
+        from .v1 import documents
+
         return documents.Documents(self.client)
 
-    @property
+    @cached_property
     def hiring(self):
+        from .v1 import hiring
+
         return hiring.Hiring(self.client)
 
-    @property
+    @cached_property
     def tables(self):
+        from .v1 import tables
+
         return tables.Tables(self.client)
 
-    @property
+    @cached_property
     def objects(self):
+        from .v1 import objects
+
         return objects.Objects(self.client)
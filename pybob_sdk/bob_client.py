@@ -1,21 +1,142 @@
 import json
 import logging
-import requests
-from requests.auth import HTTPBasicAuth
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+from .retry import RetryPolicy, RetryStats
+from .cache import MISSING, TTLCache, cache_key, conditional_headers
+from .limiter import RequestScheduler
+from .codec import JSONCodec, default_codec
+
+if TYPE_CHECKING:
+    import requests
 
 log = logging.getLogger("py-bob")
 log.setLevel(logging.INFO)
 
 
+def rewind(files=None, body=None):
+    """
+    Seek file objects back to the start so a retried request resends them in full.
+    """
+    streams = list(files.values()) if isinstance(files, dict) else []
+    streams.append(body)
+
+    for stream in streams:
+        if isinstance(stream, tuple):
+            stream = stream[1]
+        if hasattr(stream, "seek"):
+            stream.seek(0)
+
+
+def without_auth(request):
+    """
+    requests auth hook overriding the session credentials with none.
+    """
+    return request
+
+
 class BobClient:
-    def __init__(self, service_account_id: str, service_account_token: str):
+    def __init__(
+        self,
+        service_account_id: str,
+        service_account_token: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        retry: Optional[RetryPolicy] = None,
+        cache=None,
+        etag_cache=None,
+        scheduler: Optional[RequestScheduler] = None,
+        codec: Optional[JSONCodec] = None,
+    ):
+        """
+        HTTP client shared by every endpoint of a Bob instance.
+
+        Requests go through a single pooled requests.Session, so connections (and their TLS
+        handshakes) are reused across calls.
+
+        Args:
+            service_account_id (str): Bob service account ID.
+            service_account_token (str): Bob service account token.
+            pool_connections (int, optional): Number of host connection pools to cache. Default is 10.
+            pool_maxsize (int, optional): Maximum number of connections kept open per host. Default is 10.
+            keep_alive (bool, optional): Whether to keep connections open between requests. Default is True.
+            retry (RetryPolicy, optional): Retry and backoff policy for throttled or failed requests. Defaults to RetryPolicy().
+            cache (TTLCache, optional): Cache used by read-only metadata calls. Defaults to TTLCache(), SQLiteCache keeps entries on disk.
+            etag_cache (TTLCache, optional): Responses kept for ETag/Last-Modified revalidation of GET requests. Defaults to TTLCache(maxsize=64, ttl=inf, copy_values=False), maxsize=0 disables it.
+            scheduler (RequestScheduler, optional): Rate and concurrency limiter shared by all requests. Defaults to RequestScheduler().
+            codec (JSONCodec, optional): JSON encoder/decoder of request and response bodies. Defaults to orjson or msgspec when installed, json otherwise.
+        """
         self.api = "https://api.hibob.com/v1/"
         self.timeout = 30
         self.service_account_id = service_account_id
         self.service_account_token = service_account_token
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.cache = cache if cache is not None else TTLCache()
+        self.etag_cache = (
+            etag_cache
+            if etag_cache is not None
+            else TTLCache(maxsize=64, ttl=float("inf"), copy_values=False)
+        )
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+        self.codec = codec if codec is not None else default_codec()
+        self._session = None
+        self._session_lock = threading.Lock()
 
-    @staticmethod
-    def parse_response(response):
+    @property
+    def session(self) -> "requests.Session":
+        """
+        Pooled session, created on first use so importing and constructing are cheap.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self.create_session()
+
+        return self._session
+
+    def create_session(self) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
+        from requests.auth import HTTPBasicAuth
+
+        session = requests.Session()
+        session.auth = HTTPBasicAuth(
+            self.service_account_id, self.service_account_token
+        )
+        session.headers["Accept"] = "application/json"
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def close(self):
+        """
+        Close the pooled session and release its connections.
+        """
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def parse_response(self, response):
         if (
             "Content-Type" in response.headers
             and response.headers["Content-Type"] != "application/json"
@@ -24,74 +145,277 @@ class BobClient:
             return response.text
 
         try:
-            return response.json()
+            return self.codec.loads(response.content)
         except ValueError:
             log.debug("Could not convert response to json, returning raw response")
 
         return response
 
-    def make_request(
-        self, method, endpoint, json_body=None, query=None, body=None, files=None
-    ):
+    def encode_json(self, json_body, headers=None) -> dict:
+        """
+        Request parameters sending json_body encoded by self.codec.
+        """
+        return {
+            "data": self.codec.dumps(json_body),
+            "headers": {"Content-Type": "application/json", **(headers or {})},
+        }
+
+    @staticmethod
+    def then(response, callback):
+        """
+        Apply callback to a response returned by get/post/put/delete.
 
-        request = requests.get
+        Endpoints use this for post-processing so the same endpoint code works with
+        AsyncBobClient, whose methods return awaitables instead of results.
+        """
+        return callback(response)
 
-        match method:
-            case "GET":
-                request = requests.get
-            case "POST":
-                request = requests.post
-            case "PUT":
-                request = requests.put
-            case "DELETE":
-                request = requests.delete
+    def make_request(
+        self,
+        method,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
 
         request_params = {
-            "headers": {
-                "Accept": "application/json",
-            },
-            "json": json_body,
             "params": query,
             "data": body,
             "files": files,
-            "timeout": self.timeout,
+            "headers": dict(headers or {}),
+            "timeout": timeout if timeout is not None else self.timeout,
         }
 
+        if json_body is not None and body is None and not files:
+            request_params.update(self.encode_json(json_body, headers))
+        else:
+            request_params["json"] = json_body
+
+        key, cached = None, MISSING
+
+        if method == "GET":
+            key = cache_key(endpoint, query, json_body)
+            cached = self.etag_cache.get(key)
+            if cached is not MISSING:
+                request_params["headers"].update(conditional_headers(cached))
+
         endpoint = self.api + endpoint
 
-        response = request(
+        response = self.send(method, endpoint, **request_params)
+
+        if response.status_code == 304 and cached is not MISSING:
+            log.debug(f"{endpoint} not modified, returning revalidated response")
+            response = cached
+        elif key and response.status_code == 200 and conditional_headers(response):
+            self.etag_cache.set(key, response)
+
+        import requests
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as error:
+            log.exception(error)
+            log.debug(response)
+            raise error
+
+        response = self.parse_response(response)
+
+        return response
+
+    def stream(self, method, endpoint, json_body=None, query=None):
+        """
+        Send a request without reading its body.
+
+        The returned requests.Response must be closed by the caller, preferably by using it
+        as a context manager, and its body read with iter_content() or raw. endpoint may
+        also be an absolute URL, e.g. a polling Location returned by the API. Credentials
+        are only sent to the API host, not to other hosts such as signed document links.
+
+        Example:
+            with client.stream("POST", "people/search", json_body=body) as response:
+                for chunk in response.iter_content(65536):
+                    ...
+        """
+        request_params = {}
+
+        if json_body is not None:
+            request_params.update(self.encode_json(json_body))
+
+        if not endpoint.startswith(("https://", "http://")):
+            endpoint = self.api + endpoint
+        elif urlsplit(endpoint).netloc != urlsplit(self.api).netloc:
+            request_params["auth"] = without_auth
+
+        response = self.send(
+            method,
             endpoint,
-            auth=HTTPBasicAuth(self.service_account_id, self.service_account_token),
+            params=query,
+            timeout=self.timeout,
+            stream=True,
             **request_params,
         )
 
+        import requests
+
         try:
             response.raise_for_status()
         except requests.HTTPError as error:
             log.exception(error)
             log.debug(response)
+            response.close()
             raise error
 
-        response = self.parse_response(response)
+        return response
+
+    def request_headers(self, method, endpoint, query=None):
+        """
+        Send a request and return its response headers, leaving the body unread.
+
+        Used by endpoints whose result is a header, e.g. the Location of an export.
+        """
+        with self.stream(method, endpoint, query=query) as response:
+            return response.headers
+
+    def send(self, method, url, **request_params):
+        """
+        Send a request through the pooled session, retrying according to self.retry.
+
+        Every attempt is admitted by self.scheduler, backoff waits happen outside of it.
+
+        Returns the last response received, which is only an error response once the
+        retries are exhausted or the failure is not retryable.
+        """
+        import requests
+
+        attempt = 0
+
+        while True:
+            started = self.scheduler.acquire()
+
+            try:
+                response = self.session.request(method, url, **request_params)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self.scheduler.release(started)
+                if not self.retry.should_retry(method, None, attempt):
+                    raise error
+                delay = self.retry.get_delay(attempt)
+                log.warning(
+                    f"{method} {url} failed ({error}), retrying in {delay:.2f}s"
+                )
+            except BaseException:
+                self.scheduler.release(started)
+                raise
+            else:
+                self.scheduler.release(started, throttled=response.status_code == 429)
+                if response.ok or not self.retry.should_retry(
+                    method, response.status_code, attempt
+                ):
+                    return response
+                delay = self.retry.get_delay(
+                    attempt, response.headers.get("Retry-After")
+                )
+                log.warning(
+                    f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s"
+                )
+                response.close()
+
+            self.retry_stats.record(delay)
+            time.sleep(delay)
+            rewind(request_params.get("files"), request_params.get("data"))
+            attempt += 1
+
+    def get(self, endpoint, query=None, json_body=None, body=None, cache=False):
+        if not cache:
+            return self.make_request(
+                "GET", endpoint, query=query, json_body=json_body, body=body
+            )
+
+        key = cache_key(endpoint, query, json_body)
+        response = self.cache.get(key)
+
+        if response is MISSING:
+            response = self.make_request(
+                "GET", endpoint, query=query, json_body=json_body, body=body
+            )
+            if isinstance(response, (dict, list, str)):
+                self.cache.set(key, response)
 
         return response
 
-    def get(self, endpoint, query=None, json_body=None, body=None):
-        return self.make_request(
-            "GET", endpoint, query=query, json_body=json_body, body=body
-        )
+    def invalidate_after(self, response, prefix: str):
+        """
+        Drop cached GET responses under prefix once the write that produced response is done.
+        """
+
+        def invalidate(result):
+            self.cache.invalidate(prefix)
+            return result
+
+        return self.then(response, invalidate)
 
-    def post(self, endpoint, json_body=None, query=None, body=None, files=None):
+    def post(
+        self,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
         return self.make_request(
-            "POST", endpoint, json_body=json_body, query=query, body=body, files=files
+            "POST",
+            endpoint,
+            json_body=json_body,
+            query=query,
+            body=body,
+            files=files,
+            headers=headers,
+            timeout=timeout,
         )
 
-    def put(self, endpoint, json_body=None, query=None, body=None, files=None):
+    def put(
+        self,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
         return self.make_request(
-            "PUT", endpoint, json_body=json_body, query=query, body=body, files=files
+            "PUT",
+            endpoint,
+            json_body=json_body,
+            query=query,
+            body=body,
+            files=files,
+            headers=headers,
+            timeout=timeout,
         )
 
-    def delete(self, endpoint, json_body=None, query=None, body=None, files=None):
+    def delete(
+        self,
+        endpoint,
+        json_body=None,
+        query=None,
+        body=None,
+        files=None,
+        headers=None,
+        timeout=None,
+    ):
         return self.make_request(
-            "DELETE", endpoint, json_body=json_body, query=query, body=body, files=files
+            "DELETE",
+            endpoint,
+            json_body=json_body,
+            query=query,
+            body=body,
+            files=files,
+            headers=headers,
+            timeout=timeout,
         )
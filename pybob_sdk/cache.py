@@ -0,0 +1,179 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+MISSING = object()
+
+
+def cache_key(endpoint: str, query: Optional[dict] = None, json_body=None) -> str:
+    """
+    Build a cache key that starts with the endpoint, so it can be invalidated by prefix.
+    """
+    key = endpoint
+
+    if query:
+        key += "?" + urlencode(
+            sorted((k, v) for k, v in query.items() if v is not None), doseq=True
+        )
+    if json_body:
+        key += "#" + json.dumps(json_body, sort_keys=True)
+
+    return key
+
+
+def conditional_headers(response) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers from a previous response's validators.
+    """
+    headers = {}
+
+    if response.headers.get("ETag"):
+        headers["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+
+    return headers
+
+
+class TTLCache:
+    def __init__(
+        self, maxsize: int = 256, ttl: float = 300.0, copy_values: bool = True
+    ):
+        """
+        Thread safe in-memory LRU cache whose entries expire after ttl seconds.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries, the least recently used is evicted first. Default is 256, 0 disables caching.
+            ttl (float, optional): Seconds an entry stays valid. Default is 300.
+            copy_values (bool, optional): Deep copy values in and out so callers cannot mutate cached entries. Default is True.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.copy_values = copy_values
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        Return a copy of the cached value, or MISSING when absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return MISSING
+
+            expires_at, value = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return MISSING
+
+            self._entries.move_to_end(key)
+
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def set(self, key: str, value: Any):
+        if self.maxsize <= 0:
+            return
+
+        if self.copy_values:
+            value = copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = ""):
+        """
+        Drop every entry whose key starts with prefix, or all entries by default.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        self.invalidate()
+
+
+class SQLiteCache:
+    def __init__(self, path: str, maxsize: int = 1024, ttl: float = 3600.0):
+        """
+        On-disk cache with the TTLCache interface, so entries survive process restarts.
+
+        Values must be JSON serialisable, which every parsed API response is.
+
+        Args:
+            path (str): SQLite database path.
+            maxsize (int, optional): Maximum number of entries, the least recently used is evicted first. Default is 1024.
+            ttl (float, optional): Seconds an entry stays valid. Default is 3600.
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        import sqlite3
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Any:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return MISSING
+
+            if row[1] <= time.time():
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return MISSING
+
+            self._connection.execute(
+                "UPDATE cache SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        if self.maxsize <= 0:
+            return
+
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl, now),
+            )
+            self._connection.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def invalidate(self, prefix: str = ""):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+
+    def clear(self):
+        self.invalidate()
+
+    def close(self):
+        self._connection.close()
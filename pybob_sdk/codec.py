@@ -0,0 +1,76 @@
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec, the fallback used when no faster library is installed.
+
+    Codecs decode straight from the response bytes, skipping the str decoding step of
+    requests' Response.json(), and encode request bodies to bytes.
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        # Same output rules as requests' own json= encoding.
+        return json.dumps(value, allow_nan=False).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            # orjson is stricter, e.g. about NaN, let json decide.
+            return super().loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._orjson.dumps(value)
+        except TypeError:
+            return super().dumps(value)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._msgspec.json.decode(data)
+        except self._msgspec.DecodeError:
+            return super().loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._msgspec.json.encode(value)
+        except TypeError:
+            return super().dumps(value)
+
+
+def default_codec() -> JSONCodec:
+    """
+    Return the fastest available codec: orjson, then msgspec, then the standard library.
+    """
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+
+    return JSONCodec()
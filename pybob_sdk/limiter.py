@@ -0,0 +1,110 @@
+import threading
+import time
+from typing import Optional
+
+
+class RequestScheduler:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        Client side admission control shared by every request of a BobClient.
+
+        Requests are admitted through a token bucket (rate limit) and a concurrency window
+        that grows additively while requests succeed and shrinks multiplicatively when Bob
+        answers 429, so parallel callers converge on the throughput the tenant allows.
+
+        Args:
+            rate (float, optional): Sustained requests per second. Defaults to None, no rate limit.
+            burst (int, optional): Token bucket capacity. Defaults to max(1, rate).
+            initial_concurrency (int, optional): Starting number of requests allowed in flight. Default is 8.
+            min_concurrency (int, optional): Lower bound of the concurrency window. Default is 1.
+            max_concurrency (int, optional): Upper bound of the concurrency window. Default is 64.
+            increase (float, optional): Slots added per window of successful requests. Default is 1.
+            decrease_factor (float, optional): Multiplier applied to the window on a 429. Default is 0.5.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.concurrency = float(
+            min(max(initial_concurrency, min_concurrency), max_concurrency)
+        )
+        self.in_flight = 0
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            float: Admission time, to be passed back to release().
+        """
+        with self._condition:
+            while self.in_flight >= int(self.concurrency):
+                self._condition.wait()
+            self.in_flight += 1
+            wait = self._take_token()
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return time.monotonic()
+
+    def release(self, started: float, throttled: bool = False):
+        """
+        Return a slot taken by acquire() and adapt the concurrency window.
+
+        Args:
+            started (float): Value returned by acquire().
+            throttled (bool, optional): Whether the request was answered with a 429.
+        """
+        with self._condition:
+            self.in_flight -= 1
+
+            if throttled:
+                self.throttled += 1
+                # Requests admitted before the last decrease were sent under the old
+                # window, their 429s must not shrink it again.
+                if started >= self._decreased_at:
+                    self.concurrency = max(
+                        self.min_concurrency, self.concurrency * self.decrease_factor
+                    )
+                    self._decreased_at = time.monotonic()
+                    self._tokens = min(self._tokens, 0.0)
+            else:
+                self.concurrency = min(
+                    self.max_concurrency,
+                    self.concurrency + self.increase / self.concurrency,
+                )
+
+            self._condition.notify_all()
+
+    def _take_token(self) -> float:
+        if self.rate is None:
+            return 0.0
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self.rate
@@ -0,0 +1,109 @@
+import io
+import mimetypes
+import os
+import uuid
+from typing import Optional, Union
+
+
+class MultipartFile(io.RawIOBase):
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        field: str = "file",
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ):
+        """
+        Read-only multipart/form-data body holding a single file read from disk.
+
+        The part headers, the file and the closing boundary are read on demand, so the
+        body can be sent as a request's data without the file ever being loaded in
+        memory. len() gives the exact body size, letting requests send a Content-Length
+        instead of a chunked body, and seek(0) restarts it for retries.
+
+        Args:
+            path (str | PathLike): File to send.
+            field (str, optional): Form field name. Default is "file".
+            filename (str, optional): Filename sent to the server. Defaults to the base name of path.
+            content_type (str, optional): Content type of the file. Guessed from the extension by default.
+
+        Example:
+            with MultipartFile("contract.pdf") as body:
+                client.post(endpoint, body=body, headers={"Content-Type": body.content_type})
+        """
+        self.path = os.fspath(path)
+        self.boundary = uuid.uuid4().hex
+        filename = filename or os.path.basename(self.path)
+        content_type = (
+            content_type
+            or mimetypes.guess_type(filename)[0]
+            or "application/octet-stream"
+        )
+        quoted = filename.replace("\\", "\\\\").replace('"', '\\"')
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{quoted}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._file = open(self.path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._position = 0
+
+    @property
+    def content_type(self) -> str:
+        """
+        Content-Type header value of the body, including its boundary.
+        """
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self)
+
+        self._position = max(0, min(offset, len(self)))
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        written = 0
+        file_end = len(self._head) + self._size
+
+        while written < len(view) and self._position < len(self):
+            wanted = len(view) - written
+
+            if self._position < len(self._head):
+                data = self._head[self._position : self._position + wanted]
+            elif self._position < file_end:
+                self._file.seek(self._position - len(self._head))
+                data = self._file.read(min(wanted, file_end - self._position))
+                if not data:
+                    raise IOError(f"{self.path} shrank while it was being sent")
+            else:
+                offset = self._position - file_end
+                data = self._tail[offset : offset + wanted]
+
+            view[written : written + len(data)] = data
+            written += len(data)
+            self._position += len(data)
+
+        return written
+
+    def close(self):
+        self._file.close()
+        super().close()
@@ -0,0 +1,110 @@
+import random
+import threading
+import time
+from typing import Iterable, Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+    ):
+        """
+        Decides which failed requests are retried and how long to wait in between.
+
+        A 429 response means Bob rejected the request without processing it, so it is
+        retried for every method. Other retryable statuses and connection errors are only
+        retried for idempotent methods, as a POST may already have been applied.
+
+        Args:
+            max_retries (int, optional): Maximum number of retries per request. Default is 5, 0 disables retries.
+            backoff_factor (float, optional): Base delay in seconds, doubled on every attempt. Default is 0.5.
+            max_backoff (float, optional): Upper bound in seconds for the computed backoff. Default is 60.
+            retry_statuses (Iterable[int], optional): HTTP statuses considered transient.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def should_retry(
+        self, method: str, status: Optional[int], attempt: int, idempotent=None
+    ) -> bool:
+        """
+        Args:
+            method (str): HTTP method of the failed request.
+            status (int, optional): Response status, None when no response was received.
+            attempt (int): Number of retries already made.
+            idempotent (bool, optional): Overrides the method based idempotency check.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        if status == 429:
+            return True
+        if status is None or status in self.retry_statuses:
+            return idempotent
+
+        return False
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        A Retry-After header wins when present, otherwise "full jitter" exponential
+        backoff is used so concurrent callers do not retry in lockstep.
+        """
+        delay = self.parse_retry_after(retry_after)
+
+        if delay is not None:
+            return delay
+
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2**attempt)
+        )
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        # HTTP dates are rare, email.utils is only imported when one is received.
+        from email.utils import parsedate_to_datetime
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RetryStats:
+    def __init__(self):
+        """
+        Thread safe counters of the retries made by a client.
+        """
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.wait_time = 0.0
+
+    def record(self, delay: float):
+        with self._lock:
+            self.retries += 1
+            self.wait_time += delay
+
+    def reset(self):
+        with self._lock:
+            self.retries = 0
+            self.wait_time = 0.0
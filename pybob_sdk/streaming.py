@@ -0,0 +1,194 @@
+import codecs
+import json
+import os
+import zlib
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, Union
+
+GZIP_CONTENT_TYPES = ("application/gzip", "application/x-gzip")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Incrementally parse the array stored under key in a streamed JSON object.
+
+    Only the element currently being decoded is buffered, so memory stays flat no matter
+    how many elements the array holds, e.g. for the "employees" of people/search:
+
+        {"employees": [{...}, {...}, ...]}
+
+    Args:
+        chunks (Iterable[bytes]): Raw response body chunks, e.g. response.iter_content().
+        key (str): Top level key holding the array.
+
+    Yields:
+        The decoded array elements, one at a time.
+
+    Raises:
+        ValueError: When key does not hold an array or the body ends before the array does.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    marker = json.dumps(key)
+
+    def read() -> bool:
+        nonlocal buffer, position
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                buffer = buffer[position:] + text
+                position = 0
+                return True
+        return False
+
+    # Locate the opening bracket of the array, the scanned text is dropped on every read.
+    while True:
+        start = buffer.find(marker, position)
+
+        if start == -1:
+            # Keep the tail, it may hold the start of the marker.
+            position = max(position, len(buffer) - len(marker) + 1)
+        else:
+            after = buffer[start + len(marker) :].lstrip(_WHITESPACE)
+
+            if after and after[0] != ":":
+                # The marker is a string value, not the key.
+                position = start + len(marker)
+                continue
+
+            value = after[1:].lstrip(_WHITESPACE)
+
+            if value and value[0] == "[":
+                position = len(buffer) - len(value) + 1
+                break
+            if value:
+                raise ValueError(f"{key!r} does not hold an array")
+
+            position = start
+
+        if not read():
+            raise ValueError(f"The response ended before the {key!r} array")
+
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE + ",":
+            position += 1
+
+        if position < len(buffer) and buffer[position] == "]":
+            return
+
+        try:
+            element, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if not read():
+                raise
+            continue
+
+        # A number at the very end of the buffer may continue in the next chunk.
+        if end == len(buffer) and not isinstance(element, (dict, list, str)):
+            if read():
+                continue
+
+        position = end
+        yield element
+
+
+def iter_body(
+    response, chunk_size: int = 1 << 20, decompress: bool = True
+) -> Iterator[bytes]:
+    """
+    Iterate over a streamed requests.Response body in chunks of at most chunk_size bytes.
+
+    Args:
+        response (requests.Response): Response opened with stream=True.
+        chunk_size (int, optional): Bytes read from the network at a time. Default is 1 MiB.
+        decompress (bool, optional): Decode the transport Content-Encoding and gunzip
+            gzip payloads on the fly. When False the bytes are yielded exactly as they
+            were received, e.g. to keep a compressed copy on disk. Default is True.
+    """
+    if not decompress:
+        yield from response.raw.stream(chunk_size, decode_content=False)
+        return
+
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+
+    if content_type not in GZIP_CONTENT_TYPES:
+        yield from response.iter_content(chunk_size)
+        return
+
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+
+    for chunk in response.iter_content(chunk_size):
+        data = decompressor.decompress(chunk, chunk_size)
+        while data:
+            yield data
+            data = decompressor.decompress(decompressor.unconsumed_tail, chunk_size)
+
+    data = decompressor.flush()
+    if data:
+        yield data
+
+
+def content_length(response, decompress: bool = True) -> Optional[int]:
+    """
+    Number of bytes iter_body will yield, when it is known in advance.
+    """
+    length = response.headers.get("Content-Length")
+
+    if length is None or not length.isdigit():
+        return None
+    if decompress and (
+        response.headers.get("Content-Encoding")
+        or response.headers.get("Content-Type", "").startswith(GZIP_CONTENT_TYPES)
+    ):
+        return None
+
+    return int(length)
+
+
+def write_stream(
+    chunks: Iterable[bytes],
+    sink: Union[str, os.PathLike, BinaryIO],
+    progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+    total: Optional[int] = None,
+) -> int:
+    """
+    Write streamed chunks to a path or a binary file-like object.
+
+    Only one chunk is held in memory at a time. Paths are written through a temporary
+    ".part" file that is renamed once complete, so an interrupted download never leaves a
+    truncated file under the final name.
+
+    Args:
+        chunks (Iterable[bytes]): Body chunks, e.g. from iter_body.
+        sink (str | PathLike | BinaryIO): Destination path or binary file-like object.
+        progress (Callable, optional): Called as progress(written, total) after every chunk.
+        total (int, optional): Expected size passed to progress, None when unknown.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    if not isinstance(sink, (str, os.PathLike)):
+        written = 0
+        for chunk in chunks:
+            sink.write(chunk)
+            written += len(chunk)
+            if progress is not None:
+                progress(written, total)
+        return written
+
+    part = f"{os.fspath(sink)}.part"
+
+    try:
+        with open(part, "wb") as file:
+            written = write_stream(chunks, file, progress, total)
+        os.replace(part, sink)
+    except BaseException:
+        if os.path.exists(part):
+            os.remove(part)
+        raise
+
+    return written
@@ -1,10 +1,52 @@
 from .base import BobEndpoint
-from typing import List
+from .bulk import require_sync, run_concurrently
+from .attendance_files import Mapping, read_records, timestamp_normaliser, to_events
+import gzip
+import json
+from datetime import tzinfo
+from typing import Iterable, Iterator, List, Optional
+
+
+def chunk_events(
+    events: Iterable[dict], max_events: int = 1000, max_bytes: int = 1 << 20
+) -> Iterator[List[dict]]:
+    """
+    Split attendance events into lists bounded by count and by JSON encoded size.
+
+    events is consumed lazily. An event larger than max_bytes on its own is yielded as
+    a single event chunk.
+
+    Args:
+        events (Iterable[dict]): Attendance events.
+        max_events (int, optional): Maximum number of events per chunk. Default is 1000.
+        max_bytes (int, optional): Maximum encoded size of a chunk's events. Default is 1 MiB.
+    """
+    chunk, size = [], 0
+
+    for event in events:
+        # The separating comma is counted with every event.
+        event_size = len(json.dumps(event).encode()) + 1
+
+        if chunk and (len(chunk) >= max_events or size + event_size > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+
+        chunk.append(event)
+        size += event_size
+
+    if chunk:
+        yield chunk
 
 
 class Attendance(BobEndpoint):
     def import_attendance_data(
-        self, importMethod: str, idType: str, requests: List[dict], dateTimeFormat: str
+        self,
+        importMethod: str,
+        idType: str,
+        requests: List[dict],
+        dateTimeFormat: str,
+        compress: bool = False,
+        timeout: Optional[float] = None,
     ):
         """
         Import attendance data.
@@ -20,6 +62,8 @@ class Attendance(BobEndpoint):
                 clockIn (str): timestamp
                 clockOut (str): timestamp
             dateTimeFormat (str): Allows to set custom date format for the date-time values sent in the requests.
+            compress (bool, optional): Send the body gzip encoded. Default is False.
+            timeout (float, optional): Request timeout in seconds, defaults to the client timeout.
 
         Returns:
             None
@@ -33,6 +77,148 @@ class Attendance(BobEndpoint):
         json_body["requests"] = requests
         json_body["dateTimeFormat"] = dateTimeFormat
 
+        if compress:
+            return self.client.post(
+                f"attendance/import/{importMethod}",
+                body=gzip.compress(self.client.codec.dumps(json_body)),
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
+                timeout=timeout,
+            )
+
         return self.client.post(
-            f"attendance/import/{importMethod}", json_body=json_body
+            f"attendance/import/{importMethod}", json_body=json_body, timeout=timeout
+        )
+
+    def import_in_chunks(
+        self,
+        importMethod: str,
+        idType: str,
+        requests: Iterable[dict],
+        dateTimeFormat: str,
+        max_events: int = 1000,
+        max_bytes: int = 1 << 20,
+        max_workers: int = 4,
+        compress: bool = False,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """
+        Import attendance events of any volume as concurrent, size-bounded requests.
+
+        Events are split with chunk_events and every chunk is sent with
+        import_attendance_data on a bounded thread pool. requests may be a generator, only
+        the chunks in flight are held in memory. A failing chunk does not stop the others,
+        its events are returned so they can be sent again.
+
+        Args:
+            importMethod, idType, dateTimeFormat: See import_attendance_data.
+            requests (Iterable[dict]): Attendance events.
+            max_events (int, optional): Maximum number of events per request. Default is 1000.
+            max_bytes (int, optional): Maximum encoded size of a request's events. Default is 1 MiB.
+            max_workers (int, optional): Number of concurrent requests. Default is 4.
+            compress (bool, optional): Send the bodies gzip encoded. Default is False.
+            timeout (float, optional): Per request timeout in seconds, defaults to the client timeout.
+
+        Returns:
+            dict: {"chunks", "events", "results", "failed"} where results maps chunk indexes to
+                their response and failed maps chunk indexes to {"error", "events"}.
+
+        Example:
+            summary = bob.attendance.import_in_chunks(
+                "immediate", "email", clock_events, "yyyy-MM-dd'T'HH:mm", compress=True
+            )
+            retry = [event for failure in summary["failed"].values() for event in failure["events"]]
+        """
+        require_sync(self.client, "Attendance.import_in_chunks")
+
+        in_flight = {}
+        summary = {"chunks": 0, "events": 0, "results": {}, "failed": {}}
+
+        def calls():
+            chunks = chunk_events(requests, max_events, max_bytes)
+
+            for index, chunk in enumerate(chunks):
+                in_flight[index] = chunk
+                yield index, lambda chunk=chunk: self.import_attendance_data(
+                    importMethod,
+                    idType,
+                    chunk,
+                    dateTimeFormat,
+                    compress=compress,
+                    timeout=timeout,
+                )
+
+        for result in run_concurrently(calls(), max_workers=max_workers):
+            chunk = in_flight.pop(result.key)
+            summary["chunks"] += 1
+            summary["events"] += len(chunk)
+
+            if result.ok:
+                summary["results"][result.key] = result.value
+            else:
+                summary["failed"][result.key] = {"error": result.error, "events": chunk}
+
+        return summary
+
+    def import_from_file(
+        self,
+        path: str,
+        mapping: Mapping,
+        importMethod: str,
+        idType: str,
+        dateTimeFormat: str = "yyyy-MM-dd'T'HH:mm",
+        sourceFormat: Optional[str] = None,
+        sourceTimezone: Optional[tzinfo] = None,
+        fileFormat: Optional[str] = None,
+        encoding: Optional[str] = None,
+        timestampFields: Iterable[str] = ("clockIn", "clockOut"),
+        **kwargs,
+    ) -> dict:
+        """
+        Import attendance events from a CSV or NDJSON file without loading it in memory.
+
+        Records are read one at a time, mapped to events, their timestamps rewritten in
+        dateTimeFormat and the events fed to import_in_chunks, so memory use is bounded by
+        the chunks in flight whatever the file size.
+
+        Args:
+            path (str): CSV or NDJSON file.
+            mapping (Dict[str, str | Callable]): Event field to source column, or to a function of the record.
+            importMethod, idType: See import_attendance_data.
+            dateTimeFormat (str, optional): Java pattern of the timestamps sent to Bob. Default is "yyyy-MM-dd'T'HH:mm".
+            sourceFormat (str, optional): strptime format of the source timestamps, ISO 8601 when omitted.
+            sourceTimezone (tzinfo, optional): Time zone of source timestamps without an offset, e.g. ZoneInfo("Europe/London"). Required for those when dateTimeFormat has an X or Z offset.
+            fileFormat (str, optional): "csv" or "ndjson", inferred from the extension when omitted.
+            encoding (str, optional): File encoding. Defaults to UTF-8.
+            timestampFields (Iterable[str], optional): Event fields holding timestamps. Default is clockIn and clockOut.
+            **kwargs: Passed to import_in_chunks, e.g. max_events, max_workers or compress.
+
+        Returns:
+            dict: See import_in_chunks.
+
+        Raises:
+            ValueError: When a timestamp does not match sourceFormat, or lacks the offset dateTimeFormat requires. Chunks sent before the failing record are already imported.
+
+        Example:
+            summary = bob.attendance.import_from_file(
+                "clock-2024-06-03.csv",
+                {"id": "Email", "clockIn": "In", "clockOut": "Out"},
+                "immediate",
+                "email",
+                sourceFormat="%d/%m/%Y %H:%M",
+            )
+        """
+        require_sync(self.client, "Attendance.import_from_file")
+
+        events = to_events(
+            read_records(path, fileFormat, encoding),
+            mapping,
+            timestamp_normaliser(dateTimeFormat, sourceFormat, sourceTimezone),
+            timestampFields,
+        )
+
+        return self.import_in_chunks(
+            importMethod, idType, events, dateTimeFormat, **kwargs
         )
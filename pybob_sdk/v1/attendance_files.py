@@ -0,0 +1,237 @@
+import csv
+import json
+import os
+import re
+from datetime import datetime, tzinfo
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+# Runs of a pattern letter, quoted literals ('' is a quote) or any other character.
+_JAVA_TOKEN = re.compile(r"([A-Za-z])\1*|'(?:[^']|'')*'|.")
+
+Mapping = Dict[str, Union[str, Callable[[dict], Any]]]
+
+# English month names, as Java formats them in the default locale used by Bob.
+MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+def java_formatter(pattern: str) -> Callable[[datetime], str]:
+    """
+    Build a formatter for a Java DateTimeFormatter pattern such as "yyyy-MM-dd'T'HH:mm".
+
+    Bob's dateTimeFormat uses Java patterns, which strftime cannot express directly
+    (e.g. SSS milliseconds or XXX offsets). Supported letters are y, M, d, H, h, m, s,
+    S, a, X and Z, other letters raise ValueError.
+    """
+    parts = []
+
+    for match in _JAVA_TOKEN.finditer(pattern):
+        token = match.group()
+        letter, width = token[0], len(token)
+
+        if letter == "'":
+            literal = token[1:-1].replace("''", "'") if width > 2 else "'"
+            parts.append(lambda moment, literal=literal: literal)
+        elif letter == "y":
+            if width == 2:
+                parts.append(lambda moment: f"{moment.year % 100:02d}")
+            else:
+                parts.append(lambda moment, width=width: f"{moment.year:0{width}d}")
+        elif letter in "MXZ" and width > 5:
+            raise ValueError(f"Too many pattern letters {token!r} in {pattern!r}")
+        elif letter == "M" and width >= 3:
+            parts.append(lambda moment, width=width: format_month(moment, width))
+        elif letter in "MdHhms":
+            field = {
+                "M": lambda moment: moment.month,
+                "d": lambda moment: moment.day,
+                "H": lambda moment: moment.hour,
+                "h": lambda moment: moment.hour % 12 or 12,
+                "m": lambda moment: moment.minute,
+                "s": lambda moment: moment.second,
+            }[letter]
+            parts.append(
+                lambda moment, field=field, width=width: f"{field(moment):0{width}d}"
+            )
+        elif letter == "S":
+            parts.append(lambda moment, width=width: format_fraction(moment, width))
+        elif letter == "a":
+            parts.append(lambda moment: "AM" if moment.hour < 12 else "PM")
+        elif letter in "XZ":
+            parts.append(
+                lambda moment, letter=letter, width=width: format_offset(
+                    moment, letter, width
+                )
+            )
+        elif letter.isalpha():
+            raise ValueError(f"Unsupported pattern letter {letter!r} in {pattern!r}")
+        else:
+            parts.append(lambda moment, token=token: token)
+
+    return lambda moment: "".join(part(moment) for part in parts)
+
+
+def format_fraction(moment: datetime, width: int) -> str:
+    return f"{moment.microsecond:06d}"[:width].ljust(width, "0")
+
+
+def format_month(moment: datetime, width: int) -> str:
+    """
+    Text month of MMM (Jun), MMMM (June) or MMMMM (J).
+    """
+    name = MONTHS[moment.month - 1]
+    if width == 3:
+        return name[:3]
+    if width == 4:
+        return name
+    return name[0]
+
+
+def format_offset(moment: datetime, letter: str, width: int = 1) -> str:
+    """
+    Format the UTC offset of moment as Java formats X and Z letters of the given width.
+
+    X gives +01, +0130 (X), +0100 (XX, XXXX) or +01:00 (XXX, XXXXX) and Z for UTC.
+    Z gives +0100 (Z to ZZZ), GMT+01:00 (ZZZZ, GMT for UTC) or +01:00 (ZZZZZ, Z for UTC).
+    """
+    offset = moment.utcoffset()
+
+    if offset is None:
+        raise ValueError(
+            f"{moment.isoformat()} has no UTC offset, which pattern letter {letter} "
+            "requires, set sourceTimezone"
+        )
+    if not offset and (letter == "X" or width == 5):
+        return "Z"
+
+    minutes = int(offset.total_seconds() // 60)
+    sign = "-" if minutes < 0 else "+"
+    hours, minutes = divmod(abs(minutes), 60)
+
+    if letter == "X" and width == 1:
+        return f"{sign}{hours:02d}" + (f"{minutes:02d}" if minutes else "")
+    if letter == "Z" and width == 4:
+        if not offset:
+            return "GMT"
+        return f"GMT{sign}{hours:02d}:{minutes:02d}"
+
+    separator = ":" if (letter, width) in (("X", 3), ("X", 5), ("Z", 5)) else ""
+
+    return f"{sign}{hours:02d}{separator}{minutes:02d}"
+
+
+def timestamp_normaliser(
+    dateTimeFormat: str,
+    sourceFormat: Optional[str] = None,
+    sourceTimezone: Optional[tzinfo] = None,
+) -> Callable[[Any], str]:
+    """
+    Return a function rewriting source timestamps in the dateTimeFormat sent to Bob.
+
+    Args:
+        dateTimeFormat (str): Java pattern of the import, e.g. "yyyy-MM-dd'T'HH:mm".
+        sourceFormat (str, optional): strptime format of the source values. ISO 8601 is parsed when omitted.
+        sourceTimezone (tzinfo, optional): Time zone of source values without an offset. Without it such values raise ValueError when dateTimeFormat has an X or Z offset.
+    """
+    formatter = java_formatter(dateTimeFormat)
+
+    def normalise(value: Any) -> str:
+        if not isinstance(value, datetime):
+            value = str(value).strip()
+            if sourceFormat is None:
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            else:
+                value = datetime.strptime(value, sourceFormat)
+
+        if value.tzinfo is None and sourceTimezone is not None:
+            value = value.replace(tzinfo=sourceTimezone)
+
+        return formatter(value)
+
+    return normalise
+
+
+def read_csv(path: str, encoding: str = "utf-8-sig") -> Iterator[dict]:
+    """
+    Yield the rows of a CSV file as dicts keyed by header, one at a time.
+    """
+    with open(path, newline="", encoding=encoding) as source:
+        yield from csv.DictReader(source)
+
+
+def read_ndjson(path: str, encoding: str = "utf-8") -> Iterator[dict]:
+    """
+    Yield the objects of a newline delimited JSON file, skipping blank lines.
+    """
+    with open(path, encoding=encoding) as source:
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as error:
+                raise ValueError(f"{path}:{number}: invalid JSON") from error
+
+
+def read_records(
+    path: str, fileFormat: Optional[str] = None, encoding: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    Yield the records of a CSV or NDJSON file, fileFormat is inferred from the extension.
+    """
+    if fileFormat is None:
+        extension = os.path.splitext(path)[1].lower()
+        fileFormat = "csv" if extension in (".csv", ".txt") else "ndjson"
+
+    if fileFormat == "csv":
+        return read_csv(path, encoding or "utf-8-sig")
+    if fileFormat in ("ndjson", "jsonl"):
+        return read_ndjson(path, encoding or "utf-8")
+
+    raise ValueError(f"Unsupported file format {fileFormat!r}, use csv or ndjson")
+
+
+def to_events(
+    records: Iterable[dict],
+    mapping: Mapping,
+    normalise: Callable[[Any], str],
+    timestampFields: Iterable[str] = ("clockIn", "clockOut"),
+) -> Iterator[dict]:
+    """
+    Map source records to attendance events.
+
+    mapping maps event fields to a source column or to a function of the record. Empty
+    values are left out of the event, timestamp fields are normalised.
+    """
+    timestampFields = set(timestampFields)
+
+    for number, record in enumerate(records, 1):
+        event = {}
+
+        for field, source in mapping.items():
+            value = source(record) if callable(source) else record.get(source)
+
+            if value is None or value == "":
+                continue
+
+            if field in timestampFields:
+                try:
+                    value = normalise(value)
+                except ValueError as error:
+                    raise ValueError(f"Record {number}: {field} {error}") from error
+
+            event[field] = value
+
+        yield event
@@ -0,0 +1,146 @@
+import inspect
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+_AWAITABLE = object()
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of one call made by run_concurrently.
+
+    Exactly one of value and error is set, a failed call never aborts the batch.
+    """
+
+    key: Hashable
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def require_sync(client, name: str):
+    """
+    Raise TypeError when client is an AsyncBobClient, which thread pool helpers cannot drive.
+    """
+    if inspect.iscoroutinefunction(client.get):
+        raise TypeError(
+            f"{name} needs a synchronous Bob client, with AsyncBob await the endpoint "
+            "calls it is built on instead"
+        )
+
+
+def _call(call: Callable[[], Any]) -> Any:
+    value = call()
+
+    if inspect.isawaitable(value):
+        # Returned by AsyncBobClient endpoints, close it so it is not left unawaited.
+        getattr(value, "close", lambda: None)()
+        return _AWAITABLE
+
+    return value
+
+
+def run_concurrently(
+    calls: Iterable[Tuple[Hashable, Callable[[], Any]]], max_workers: int = 8
+) -> Iterator[BulkResult]:
+    """
+    Run (key, call) pairs on a bounded thread pool and yield results as they complete.
+
+    calls is consumed lazily and at most 2 * max_workers calls are queued at any time, so
+    arbitrarily large generators can be fed without materialising them.
+
+    Args:
+        calls (Iterable[Tuple[Hashable, Callable]]): Pairs of result key and zero argument callable.
+        max_workers (int, optional): Number of worker threads. Default is 8.
+
+    Yields:
+        BulkResult: One result per call, in completion order.
+
+    Raises:
+        TypeError: When a call returns an awaitable, i.e. it was made through AsyncBob.
+    """
+    calls = iter(calls)
+    max_pending = max_workers * 2
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+
+        def submit():
+            for key, call in calls:
+                pending[executor.submit(_call, call)] = key
+                if len(pending) >= max_pending:
+                    break
+
+        submit()
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    key = pending.pop(future)
+                    error = future.exception()
+
+                    if error is None and future.result() is _AWAITABLE:
+                        raise TypeError(
+                            "run_concurrently needs synchronous calls, with AsyncBob "
+                            "await the endpoint calls with asyncio.gather instead"
+                        )
+                    if error is None:
+                        yield BulkResult(key=key, value=future.result())
+                    else:
+                        yield BulkResult(key=key, error=error)
+
+                submit()
+        finally:
+            # Stop queued calls when the consumer abandons the iteration early.
+            for future in pending:
+                future.cancel()
+
+
+class Journal:
+    def __init__(self, path: str):
+        """
+        Append-only JSON lines record of the progress of a bulk job, used to resume it.
+
+        Every line is flushed and synced before moving on, so a crash loses at most the
+        line being written, and load() returns the last entry recorded per key.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, dict]:
+        """
+        Return the last entry recorded for every key.
+        """
+        entries = {}
+
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn last line left by a crash mid-write.
+                    continue
+                entries[entry["key"]] = entry
+
+        return entries
+
+    def record(self, key: str, status: str, **details):
+        line = json.dumps({"key": key, "status": status, **details}, default=str)
+
+        with self._lock, open(self.path, "a", encoding="utf-8") as journal:
+            journal.write(line + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
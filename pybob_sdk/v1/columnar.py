@@ -0,0 +1,229 @@
+import logging
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from .directory import field_path
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+log = logging.getLogger("py-bob")
+
+
+def require_pyarrow():
+    if pyarrow is None:
+        raise ImportError(
+            "Arrow conversion requires pyarrow, install it with `pip install pybob-sdk[arrow]`"
+        )
+
+
+def field_types(field_metadata: Iterable[dict]) -> Dict[str, str]:
+    """
+    Map field paths to Bob field types using the output of Metadata.fields.get().
+
+    Returns:
+        Dict[str, str]: e.g. {"/root/email": "text", "/work/startDate": "date"}
+    """
+    return {
+        field_path(field["id"]): field.get("type")
+        for field in field_metadata
+        if field.get("id")
+    }
+
+
+def records_of(response: Any) -> Iterable[dict]:
+    """
+    Return the row list of a people/search or JSON report response.
+    """
+    if isinstance(response, dict):
+        if "employees" in response:
+            return response["employees"]
+        lists = [value for value in response.values() if isinstance(value, list)]
+        if len(lists) == 1:
+            return lists[0]
+        raise ValueError("Could not find the rows of the response")
+
+    return response
+
+
+def flatten(record: dict) -> Dict[str, Any]:
+    """
+    Flatten a row into {field path: value}.
+
+    Rows that carry "/root/email"-style keys are reduced to those keys with their
+    {"value": ...} wrappers removed, other rows have their nested objects flattened and
+    their top level values placed under /root.
+    """
+    paths = {
+        key: value["value"] if isinstance(value, dict) and "value" in value else value
+        for key, value in record.items()
+        if key.startswith("/")
+    }
+
+    if paths:
+        return paths
+
+    def walk(value, prefix):
+        for key, item in value.items():
+            if isinstance(item, dict) and item and "value" not in item:
+                yield from walk(item, f"{prefix}/{key}")
+            elif isinstance(item, dict) and "value" in item:
+                yield f"{prefix}/{key}", item["value"]
+            else:
+                yield f"{prefix}/{key}", item
+
+    flat = {}
+
+    for key, value in record.items():
+        if isinstance(value, dict) and value and "value" not in value:
+            flat.update(walk(value, f"/{key}"))
+        else:
+            flat.update(walk({key: value}, "/root"))
+
+    return flat
+
+
+def to_columns(records: Iterable[dict]) -> Dict[str, List[Any]]:
+    """
+    Convert rows to {field path: column values} in a single pass.
+
+    records may be a generator, e.g. People.search_iter, so the full response never
+    needs to exist as a list of dicts. Missing values are filled with None.
+    """
+    columns: Dict[str, List[Any]] = {}
+    rows = 0
+
+    for record in records:
+        for path, value in flatten(record).items():
+            column = columns.get(path)
+            if column is None:
+                column = columns[path] = [None] * rows
+            column.append(value)
+
+        rows += 1
+
+        for column in columns.values():
+            if len(column) < rows:
+                column.append(None)
+
+    return columns
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """
+    Parse an ISO date, raising ValueError for other values such as "02/01/2024".
+    """
+    if isinstance(value, date) or value is None:
+        return value
+    if value == "":
+        return None
+    return date.fromisoformat(str(value)[:10])
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """
+    Parse a number, raising ValueError for other values such as "1,234".
+    """
+    if isinstance(value, dict):
+        value = value.get("value")
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except TypeError as error:
+        raise ValueError(f"Not a number: {value!r}") from error
+
+
+def text_array(values: List[Any]):
+    return pyarrow.array(
+        [None if value is None else str(value) for value in values],
+        pyarrow.string(),
+    )
+
+
+def to_array(values: List[Any], field_type: Optional[str] = None):
+    """
+    Build a pyarrow array from column values using the Bob field type when it is known.
+
+    A number or date column holding a value that does not convert, e.g. a human readable
+    "02/01/2024", is kept as a string column rather than losing the value.
+    """
+    require_pyarrow()
+
+    if field_type in ("number", "date"):
+        parse, arrow_type = {
+            "number": (parse_number, pyarrow.float64()),
+            "date": (parse_date, pyarrow.date32()),
+        }[field_type]
+        try:
+            return pyarrow.array([parse(value) for value in values], arrow_type)
+        except ValueError as error:
+            log.warning(f"Keeping a {field_type} column as text: {error}")
+            return text_array(values)
+    if field_type == "multi-list":
+        return pyarrow.array(
+            [
+                None if value is None else [str(item) for item in value]
+                for value in values
+            ],
+            pyarrow.list_(pyarrow.string()),
+        )
+    if field_type in (
+        "text",
+        "text-area",
+        "list",
+        "hierarchy-list",
+        "employee-reference",
+    ):
+        return text_array(values)
+
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return text_array(values)
+
+
+def to_arrow(records: Any, field_metadata: Optional[Iterable[dict]] = None):
+    """
+    Convert people/search or JSON report rows to a pyarrow.Table.
+
+    Column names are the field paths ("/root/email"), and columns whose field appears in
+    field_metadata get a matching Arrow type: number to float64, date to date32,
+    multi-list to list<string>, text and list fields to string. Other columns are
+    inferred. Use table.to_batches() for RecordBatches or table.to_pandas() for pandas.
+
+    Args:
+        records: A response dict, a list of rows or a row iterator such as People.search_iter().
+        field_metadata (Iterable[dict], optional): Output of Metadata.fields.get().
+
+    Returns:
+        pyarrow.Table
+    """
+    require_pyarrow()
+
+    types = field_types(field_metadata or [])
+    columns = to_columns(records_of(records))
+
+    return pyarrow.table(
+        {path: to_array(values, types.get(path)) for path, values in columns.items()}
+    )
+
+
+def write_parquet(
+    records: Any,
+    path: str,
+    field_metadata: Optional[Iterable[dict]] = None,
+    **kwargs,
+):
+    """
+    Write rows to a Parquet file, see to_arrow for the conversion.
+
+    Extra keyword arguments are passed to pyarrow.parquet.write_table, e.g. compression.
+    """
+    require_pyarrow()
+
+    from pyarrow import parquet
+
+    parquet.write_table(to_arrow(records, field_metadata), path, **kwargs)
@@ -0,0 +1,164 @@
+import codecs
+import csv
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+_NUMBER = re.compile(r"-?[\d.,]*\d")
+# Commas are only accepted as thousands separators, "1,5" or "1.234,50" are refused.
+_GROUPED = re.compile(r"-?\d{1,3}(,\d{3})*(\.\d+)?")
+
+
+def iter_lines(chunks: Iterable[bytes], encoding: str = "utf-8-sig") -> Iterator[str]:
+    """
+    Incrementally decode byte chunks and yield "\\n" terminated lines.
+
+    Only newlines split lines, so csv.reader still sees quoted fields spanning lines.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def ungroup(number: str) -> str:
+    """
+    Remove the thousands separators of "1,234.50", refusing any other use of commas.
+
+    Comma decimal values such as "12,50" raise ValueError instead of being misread.
+    """
+    if "," in number and not _GROUPED.fullmatch(number):
+        raise ValueError(f"Ambiguous number: {number!r}")
+    return number.replace(",", "")
+
+
+def parse_number(value: str):
+    number = ungroup(value.strip())
+    try:
+        return int(number)
+    except ValueError:
+        return float(number)
+
+
+def parse_currency(value: str) -> Decimal:
+    """
+    Parse amounts such as "1,234.50", "£1,234.50", "1,234.50 GBP", "-£1,234.50" or the
+    accounting "(1,234.50)".
+
+    A sign may precede the number or its currency, any other sign or parenthesis raises
+    ValueError rather than guessing.
+    """
+    text = value.strip()
+    negative = text.startswith("(") and text.endswith(")")
+
+    if negative:
+        text = text[1:-1].strip()
+
+    match = _NUMBER.search(text)
+    if match is None:
+        raise ValueError(f"Not an amount: {value!r}")
+
+    number, prefix, suffix = match.group(), text[: match.start()], text[match.end() :]
+
+    if "-" in prefix and not negative and not number.startswith("-"):
+        negative, prefix = True, prefix.replace("-", "", 1)
+    if number.startswith("-") and negative:
+        raise ValueError(f"Not an amount: {value!r}")
+    if any(sign in prefix + suffix for sign in "-()"):
+        raise ValueError(f"Not an amount: {value!r}")
+
+    try:
+        amount = Decimal(ungroup(number))
+    except InvalidOperation as error:
+        raise ValueError(f"Not an amount: {value!r}") from error
+
+    return -amount if negative else amount
+
+
+def date_parser(date_format: Optional[str] = None) -> Callable[[str], date]:
+    """
+    Return a parser for report dates, ISO dates are always accepted.
+
+    Args:
+        date_format (str, optional): strptime format of the company date format, e.g. "%d/%m/%Y".
+    """
+
+    def parse(value: str) -> date:
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            if date_format is None:
+                raise
+            return datetime.strptime(value, date_format).date()
+
+    return parse
+
+
+def coercer(field_type: Optional[str], date_format: Optional[str] = None):
+    """
+    Return the function converting a CSV cell of a Bob field type, None keeps str.
+    """
+    match field_type:
+        case "date":
+            return date_parser(date_format)
+        case "number":
+            return parse_number
+        case "currency":
+            return parse_currency
+        case _:
+            return None
+
+
+def iter_typed_rows(
+    lines: Iterable[str],
+    column_types: Optional[Dict[str, str]] = None,
+    date_format: Optional[str] = None,
+    strict: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse CSV lines into dicts keyed by column header with typed values.
+
+    Empty cells become None. A cell that cannot be converted is kept as str, or raises
+    ValueError when strict is True.
+
+    Args:
+        lines (Iterable[str]): CSV lines, e.g. from iter_lines.
+        column_types (Dict[str, str], optional): Bob field type per column header: date, number or currency.
+        date_format (str, optional): strptime format of non ISO dates.
+        strict (bool, optional): Raise on values that do not match their column type. Default is False.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+
+    if header is None:
+        return
+
+    column_types = column_types or {}
+    converters = [coercer(column_types.get(name), date_format) for name in header]
+
+    for row in reader:
+        record = {}
+
+        for name, converter, value in zip(header, converters, row):
+            if value == "":
+                record[name] = None
+            elif converter is None:
+                record[name] = value
+            else:
+                try:
+                    record[name] = converter(value)
+                except ValueError:
+                    if strict:
+                        raise
+                    record[name] = value
+
+        yield record
@@ -0,0 +1,260 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .bulk import require_sync
+
+log = logging.getLogger("py-bob")
+
+
+def field_path(path: str) -> str:
+    """
+    Normalise "work.department" and "/work/department" to the "/work/department" form.
+    """
+    return "/" + path.strip("/").replace(".", "/")
+
+
+def field_value(employee: dict, path: str) -> Any:
+    """
+    Read a field from a people/search entry.
+
+    Handles both the flat "/work/department": {"value": ...} keys returned for requested
+    fields and the nested {"work": {"department": ...}} form.
+    """
+    path = field_path(path)
+
+    if path in employee:
+        value = employee[path]
+        if isinstance(value, dict) and "value" in value:
+            return value["value"]
+        return value
+
+    value = employee
+    for part in path.strip("/").split("/"):
+        if part == "root" and value is employee:
+            continue
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+
+    return value
+
+
+class PeopleDirectory:
+    def __init__(
+        self,
+        people,
+        fields: Optional[List[str]] = None,
+        index: Iterable[str] = (),
+        refresh_interval: float = 300.0,
+        database: Optional[str] = None,
+        showInactive: Optional[bool] = None,
+        retry_interval: float = 30.0,
+    ):
+        """
+        Local replica of the company directory answering lookups without network calls.
+
+        The directory is loaded with People.search_iter and kept in memory with hash indexes
+        on id, email and any additional field paths. The first lookup made after
+        refresh_interval seconds starts a reload in a background thread, and lookups keep
+        being answered from the current snapshot until the new one replaces it. A failed
+        reload keeps the current snapshot and is retried after retry_interval seconds.
+        When a SQLite database path is given the snapshot is persisted there, so a new
+        process can start from it instead of the API.
+
+        Args:
+            people (People): People endpoint used to load the directory.
+            fields (List[str], optional): Field paths to load, root.id and root.email are always added. Defaults to Bob's basic fields.
+            index (Iterable[str], optional): Additional field paths to index, e.g. "/work/department".
+            refresh_interval (float, optional): Seconds before the replica is considered stale. Default is 300.
+            database (str, optional): SQLite database path used to persist the snapshot.
+            showInactive (bool, optional): Whether to include inactive employees.
+            retry_interval (float, optional): Seconds before a failed background reload is retried. Default is 30.
+
+        Example:
+            directory = bob.people.directory(index=["/work/department"])
+            employee = directory.get("anakin.skywalker@company.com")
+            engineers = directory.find("/work/department", "Engineering")
+        """
+        require_sync(people.client, "PeopleDirectory")
+
+        self.people = people
+        self.fields = fields
+        if fields:
+            self.fields = list(dict.fromkeys([*fields, "root.id", "root.email"]))
+        self.index_paths = [field_path(path) for path in index]
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.database = database
+        self.showInactive = showInactive
+        self.refreshed_at = 0.0
+        self.refresh_error: Optional[BaseException] = None
+        self._retry_at = 0.0
+        self._by_id: Dict[str, dict] = {}
+        self._by_email: Dict[str, dict] = {}
+        self._indexes: Dict[str, Dict[Any, List[dict]]] = {}
+        self._lock = threading.Lock()
+
+        if database:
+            self._load_database()
+
+    def refresh(self):
+        """
+        Reload the directory from the API, replacing the current snapshot atomically.
+        """
+        employees = list(
+            self.people.search_iter(fields=self.fields, showInactive=self.showInactive)
+        )
+        refreshed_at = time.time()
+
+        self._build(employees)
+        self.refreshed_at = refreshed_at
+
+        if self.database:
+            self._save_database(self._by_id, refreshed_at)
+
+        log.debug(f"Loaded {len(employees)} employees into the people directory")
+
+    def get(self, identifier: str) -> Optional[dict]:
+        """
+        Look up an employee by id or email.
+        """
+        self._ensure_fresh()
+
+        if "@" in identifier:
+            return self._by_email.get(identifier.lower())
+
+        return self._by_id.get(identifier)
+
+    def find(self, path: str, value: Any) -> List[dict]:
+        """
+        Return the employees whose field at path equals value.
+
+        Indexed paths are answered from their hash index, other paths by a full scan.
+        """
+        self._ensure_fresh()
+
+        path = field_path(path)
+        index = self._indexes.get(path)
+
+        if index is not None:
+            return list(index.get(value, ()))
+
+        return [
+            employee
+            for employee in self._by_id.values()
+            if field_value(employee, path) == value
+        ]
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[dict]:
+        self._ensure_fresh()
+        return iter(list(self._by_id.values()))
+
+    def _ensure_fresh(self):
+        now = time.time()
+
+        if now - self.refreshed_at < self.refresh_interval:
+            return
+
+        if not self.refreshed_at:
+            # Nothing to serve yet, the first load is made by the caller.
+            with self._lock:
+                # Another thread may have loaded while this one waited for the lock.
+                if not self.refreshed_at:
+                    self.refresh()
+            return
+
+        if now < self._retry_at or not self._lock.acquire(blocking=False):
+            return
+
+        threading.Thread(
+            target=self._refresh_in_background,
+            name="bob-people-directory",
+            daemon=True,
+        ).start()
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+            self.refresh_error = None
+        except Exception as error:
+            self.refresh_error = error
+            self._retry_at = time.time() + self.retry_interval
+            log.warning(
+                f"People directory reload failed, keeping the snapshot: {error}"
+            )
+        finally:
+            self._lock.release()
+
+    def _build(self, employees: List[dict]):
+        by_id = {}
+        by_email = {}
+        indexes = {path: {} for path in self.index_paths}
+
+        for employee in employees:
+            employeeId = field_value(employee, "/root/id")
+            email = field_value(employee, "/root/email")
+
+            if employeeId is not None:
+                by_id[str(employeeId)] = employee
+            if email:
+                by_email[email.lower()] = employee
+
+            for path, index in indexes.items():
+                value = field_value(employee, path)
+                values = value if isinstance(value, list) else [value]
+                for value in values:
+                    try:
+                        index.setdefault(value, []).append(employee)
+                    except TypeError:
+                        continue
+
+        self._by_id, self._by_email, self._indexes = by_id, by_email, indexes
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.database)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS employees (id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS snapshot (id INTEGER PRIMARY KEY CHECK (id = 0), refreshed_at REAL NOT NULL)"
+        )
+        return connection
+
+    def _load_database(self):
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT refreshed_at FROM snapshot WHERE id = 0"
+            ).fetchone()
+            if row is None:
+                return
+            employees = [
+                json.loads(data)
+                for (data,) in connection.execute("SELECT data FROM employees")
+            ]
+
+        self._build(employees)
+        self.refreshed_at = row[0]
+
+    def _save_database(self, by_id: Dict[str, dict], refreshed_at: float):
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM employees")
+            connection.executemany(
+                "INSERT INTO employees (id, data) VALUES (?, ?)",
+                (
+                    (employeeId, json.dumps(employee))
+                    for employeeId, employee in by_id.items()
+                ),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshot (id, refreshed_at) VALUES (0, ?)",
+                (refreshed_at,),
+            )
@@ -0,0 +1,125 @@
+import hashlib
+import os
+import re
+from typing import Iterable, Iterator, Optional
+
+from ..streaming import content_length, write_stream
+
+_UNSAFE = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def documents_of(response) -> list:
+    """
+    Return the document list of a Documents.download_documents response.
+    """
+    if isinstance(response, dict):
+        return response.get("documents") or []
+    return response or []
+
+
+def document_url(document: dict) -> Optional[str]:
+    for field in ("downloadUrl", "url", "documentUrl", "fileUrl"):
+        if document.get(field):
+            return document[field]
+    return None
+
+
+def safe_name(name: str) -> str:
+    """
+    Make a document name usable as a file name on every platform.
+    """
+    name = _UNSAFE.sub("_", name).strip().lstrip(".")
+    return name or "document"
+
+
+def document_path(employeeId: str, document: dict) -> str:
+    """
+    Path of a document relative to the export root: <employeeId>/<docId>-<name>.
+
+    The document id keeps documents sharing a name apart.
+    """
+    name = safe_name(str(document.get("name") or "document"))
+
+    if document.get("id") is not None:
+        name = f"{document['id']}-{name}"
+
+    return os.path.join(safe_name(str(employeeId)), name)
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def hashing(chunks: Iterable[bytes], digest) -> Iterator[bytes]:
+    """
+    Pass chunks through while feeding them to digest.
+    """
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
+def export_document(
+    client,
+    journal,
+    entries: dict,
+    url: str,
+    destination: str,
+    relative: str,
+    verify: bool = False,
+    chunk_size: int = 1 << 20,
+) -> dict:
+    """
+    Download one document to destination/relative unless an identical copy is present.
+
+    A file recorded in the manifest is skipped when its size matches, and its SHA-256
+    too when verify is True, without contacting Bob. A file missing from the manifest is
+    skipped when its size matches the Content-Length of the download. Downloads are
+    streamed through a ".part" file, so an interrupted one never looks complete.
+
+    Returns:
+        dict: {"path", "status", "size", "sha256"}, status being downloaded or skipped.
+    """
+    path = os.path.join(destination, relative)
+    entry = entries.get(relative)
+
+    if entry and entry.get("status") == "done" and os.path.isfile(path):
+        if os.path.getsize(path) == entry.get("size") and (
+            not verify or file_sha256(path) == entry.get("sha256")
+        ):
+            return {
+                "path": path,
+                "status": "skipped",
+                "size": entry["size"],
+                "sha256": entry.get("sha256"),
+            }
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with client.stream("GET", url) as response:
+        length = content_length(response)
+
+        if (
+            entry is None
+            and length is not None
+            and os.path.isfile(path)
+            and os.path.getsize(path) == length
+        ):
+            size, sha256, status = length, file_sha256(path), "skipped"
+        else:
+            digest = hashlib.sha256()
+            # iter_content keeps files stored as gzip byte for byte.
+            size = write_stream(
+                hashing(response.iter_content(chunk_size), digest), path
+            )
+            sha256, status = digest.hexdigest(), "downloaded"
+
+    journal.record(relative, "done", size=size, sha256=sha256)
+
+    return {"path": path, "status": status, "size": size, "sha256": sha256}
@@ -0,0 +1,241 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .bulk import require_sync
+from .document_export import document_url, documents_of, file_sha256
+
+log = logging.getLogger("py-bob")
+
+
+def document_id(response) -> Optional[str]:
+    """
+    Return the document id of an upload response, None when it carries none.
+    """
+    if isinstance(response, dict):
+        response = response.get("id", response.get("documentId"))
+    if isinstance(response, (int, str)) and str(response):
+        return str(response)
+    return None
+
+
+class UploadIndex:
+    def __init__(self, documents, database: str):
+        """
+        Local index of uploaded content used to skip uploading the same file twice.
+
+        Uploads made through upload_file/upload_document are hashed (SHA-256 of the file,
+        or of the URL for upload_document) and recorded as (employeeId, folderId, hash)
+        to the document id Bob returned. A later upload of the same content to the same
+        folder returns the recorded id without sending anything.
+
+        Uploads of the same content to the same folder are serialised, so concurrent
+        callers such as Documents.bulk_upload upload it once and share the id.
+
+        Documents deleted in Bob are forgotten by refresh(), which reconciles the index
+        with download_documents listings, and can also index documents uploaded by other
+        means by downloading and hashing them.
+
+        Args:
+            documents (Documents): Documents endpoint used to upload and list.
+            database (str): SQLite database path holding the index.
+
+        Example:
+            index = bob.documents.dedupe_index("uploads.db")
+            for employeeId in new_starters:
+                index.upload_file(employeeId, "policies/handbook.pdf")
+        """
+        require_sync(documents.client, "UploadIndex")
+
+        self.documents = documents
+        self.database = database
+        self._locks: Dict[Tuple[str, str, str], list] = {}
+        self._locks_lock = threading.Lock()
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "employee_id TEXT NOT NULL, folder_id TEXT NOT NULL, "
+                "sha256 TEXT NOT NULL, document_id TEXT NOT NULL, name TEXT, "
+                "PRIMARY KEY (employee_id, folder_id, sha256))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.database)
+
+    @contextmanager
+    def _locked(self, employeeId: str, folderId: str, sha256: str) -> Iterator[None]:
+        """
+        Hold the lock of one (employeeId, folderId, sha256) key, dropped once unused.
+        """
+        key = (str(employeeId), folderId.lower(), sha256)
+
+        with self._locks_lock:
+            # [lock, number of threads holding or waiting for it]
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._locks_lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._locks[key]
+
+    def lookup(self, employeeId: str, folderId: str, sha256: str) -> Optional[str]:
+        """
+        Return the id of the document holding this content, None when unknown.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT document_id FROM uploads "
+                "WHERE employee_id = ? AND folder_id = ? AND sha256 = ?",
+                (str(employeeId), folderId.lower(), sha256),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def record(
+        self,
+        employeeId: str,
+        folderId: str,
+        sha256: str,
+        documentId: str,
+        name: Optional[str] = None,
+    ):
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO uploads "
+                "(employee_id, folder_id, sha256, document_id, name) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (str(employeeId), folderId.lower(), sha256, str(documentId), name),
+            )
+
+    def upload_file(
+        self,
+        employeeId: str,
+        path: Union[str, os.PathLike],
+        folderId: str = "shared",
+    ) -> dict:
+        """
+        Upload a file from disk unless the same content is already in the folder.
+
+        Returns:
+            dict: {"id", "uploaded"}, uploaded is False when the upload was skipped.
+        """
+        sha256 = file_sha256(os.fspath(path))
+
+        with self._locked(employeeId, folderId, sha256):
+            existing = self.lookup(employeeId, folderId, sha256)
+
+            if existing is not None:
+                log.debug(f"{path} already uploaded to {employeeId} as {existing}")
+                return {"id": existing, "uploaded": False}
+
+            response = self.documents.upload_file(
+                employeeId, path, folderId, stream=True
+            )
+            uploaded = document_id(response)
+
+            if uploaded is not None:
+                self.record(
+                    employeeId, folderId, sha256, uploaded, os.path.basename(path)
+                )
+
+        return {"id": uploaded, "uploaded": True}
+
+    def upload_document(
+        self,
+        employeeId: str,
+        folderId: str = "shared",
+        documentName: Optional[str] = None,
+        documentUrl: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> dict:
+        """
+        Upload a document by URL unless the same URL is already in the folder.
+
+        Returns:
+            dict: {"id", "uploaded"}, uploaded is False when the upload was skipped.
+        """
+        sha256 = "url:" + hashlib.sha256((documentUrl or "").encode()).hexdigest()
+
+        with self._locked(employeeId, folderId, sha256):
+            existing = self.lookup(employeeId, folderId, sha256)
+
+            if existing is not None:
+                return {"id": existing, "uploaded": False}
+
+            response = self.documents.upload_document(
+                employeeId, folderId, documentName, documentUrl, tags
+            )
+            uploaded = document_id(response)
+
+            if uploaded is not None:
+                self.record(employeeId, folderId, sha256, uploaded, documentName)
+
+        return {"id": uploaded, "uploaded": True}
+
+    def refresh(self, employeeIds: Iterable[str], hashContent: bool = False) -> int:
+        """
+        Reconcile the index with the employees' current documents.
+
+        Entries whose document is no longer listed are removed. With hashContent, listed
+        documents missing from the index are downloaded, hashed and added, provided the
+        listing tells their folderId.
+
+        Returns:
+            int: Number of entries added minus entries removed.
+        """
+        change = 0
+
+        for employeeId in employeeIds:
+            listed = documents_of(self.documents.download_documents(employeeId))
+            ids = {str(document["id"]) for document in listed if "id" in document}
+
+            with closing(self._connect()) as connection, connection:
+                known = {
+                    known_id
+                    for (known_id,) in connection.execute(
+                        "SELECT document_id FROM uploads WHERE employee_id = ?",
+                        (str(employeeId),),
+                    )
+                }
+                stale = known - ids
+                connection.executemany(
+                    "DELETE FROM uploads WHERE employee_id = ? AND document_id = ?",
+                    [(str(employeeId), stale_id) for stale_id in stale],
+                )
+                change -= len(stale)
+
+            if not hashContent:
+                continue
+
+            for document in listed:
+                url = document_url(document)
+                folder = document.get("folderId")
+
+                if str(document.get("id")) in known or not url or folder is None:
+                    continue
+
+                digest = hashlib.sha256()
+                with self.documents.client.stream("GET", url) as response:
+                    for chunk in response.iter_content(1 << 20):
+                        digest.update(chunk)
+
+                self.record(
+                    employeeId,
+                    str(folder),
+                    digest.hexdigest(),
+                    document["id"],
+                    document.get("name"),
+                )
+                change += 1
+
+        return change
@@ -1,5 +1,11 @@
 from .base import BobEndpoint
-from typing import Optional, List
+from .bulk import BulkResult, Journal, require_sync, run_concurrently
+from .document_export import document_path, document_url, documents_of, export_document
+from .document_index import UploadIndex
+from ..multipart import MultipartFile
+import os
+from functools import partial
+from typing import Iterable, Iterator, Optional, List, Tuple, Union
 
 
 class Documents(BobEndpoint):
@@ -48,13 +54,24 @@ class Documents(BobEndpoint):
 
         return self.client.post(endpoint, json_body=json_body)
 
-    def upload_file(self, employeeId: str, file: str, folderId: str = "shared"):
+    def upload_file(
+        self,
+        employeeId: str,
+        file: Union[str, os.PathLike],
+        folderId: str = "shared",
+        stream: Optional[bool] = None,
+    ):
         """
         Upload a file to the employee's folder.
 
+        A path to an existing file is streamed from disk as a multipart body, other
+        values are passed to requests as the file as before.
+
         Args:
             employeeId (str): Employee ID.
-            file (file): The file to upload.
+            file (str | PathLike | file): Path of the file, or the file to upload.
+            folderId (str, optional): Folder ID. Possible values are shared, confidential, or custom. Default is shared.
+            stream (bool, optional): Always treat file as a path to stream, raising FileNotFoundError when it does not exist. Defaults to streaming existing paths only.
 
         Returns:
             200: Uploaded document ID.
@@ -77,8 +94,78 @@ class Documents(BobEndpoint):
             case _:
                 endpoint = f"docs/people/{employeeId}/folders/{folderId}/upload"
 
+        if stream is None:
+            stream = isinstance(file, (str, os.PathLike)) and os.path.isfile(file)
+
+        if stream:
+            body = MultipartFile(file)
+
+            def close(result):
+                body.close()
+                return result
+
+            try:
+                response = self.client.post(
+                    endpoint, body=body, headers={"Content-Type": body.content_type}
+                )
+            except BaseException:
+                body.close()
+                raise
+
+            # Closed once the upload is done, which is later for AsyncBobClient.
+            return self.client.then(response, close)
+
         return self.client.post(endpoint, files={"file": file})
 
+    def bulk_upload(
+        self,
+        uploads: Iterable[Tuple[str, Union[str, os.PathLike], str]],
+        max_workers: int = 8,
+        index: Optional[UploadIndex] = None,
+    ) -> Iterator[BulkResult]:
+        """
+        Upload many files from disk concurrently.
+
+        Every file is streamed as a multipart body, so only a small buffer per upload is
+        held in memory. Uploads run on a bounded thread pool and results are yielded as
+        soon as they complete, a failing upload is reported on its BulkResult instead of
+        aborting the batch.
+
+        Args:
+            uploads (Iterable[Tuple[str, str, str]]): (employeeId, path, folderId) tuples, consumed lazily.
+            max_workers (int, optional): Number of concurrent uploads. Default is 8.
+            index (UploadIndex, optional): Skip files whose content is already in the folder, see dedupe_index.
+
+        Yields:
+            BulkResult: key is the (employeeId, path, folderId) tuple, value the upload response,
+                or the {"id", "uploaded"} dict of UploadIndex.upload_file when index is given.
+
+        Example:
+            uploads = ((row["id"], row["contract"], "confidential") for row in rows)
+            failed = [result.key for result in bob.documents.bulk_upload(uploads) if not result.ok]
+        """
+        require_sync(self.client, "Documents.bulk_upload")
+
+        if index is not None:
+            upload = index.upload_file
+        else:
+            upload = partial(self.upload_file, stream=True)
+
+        calls = (
+            ((employeeId, path, folderId), partial(upload, employeeId, path, folderId))
+            for employeeId, path, folderId in uploads
+        )
+
+        return run_concurrently(calls, max_workers=max_workers)
+
+    def dedupe_index(self, database: str) -> UploadIndex:
+        """
+        Create an index of uploaded content, skipping uploads already present in Bob.
+
+        See UploadIndex for the arguments.
+        """
+        return UploadIndex(self, database)
+
     def delete_document(self, employeeId: str, docId: str, folderId: str):
         """
         Delete a specific document from the employee's shared folder.
@@ -129,3 +216,85 @@ class Documents(BobEndpoint):
         """
 
         return self.client.get(f"docs/people/{employeeId}")
+
+    def export_documents(
+        self,
+        employeeIds: Iterable[str],
+        destination: Union[str, os.PathLike],
+        max_workers: int = 8,
+        list_workers: int = 4,
+        verify: bool = False,
+        chunk_size: int = 1 << 20,
+    ) -> Iterator[BulkResult]:
+        """
+        Download every document of many employees to a local directory.
+
+        Listings are fetched concurrently and fed as they arrive to a second bounded
+        pool streaming the files to destination/<employeeId>/<docId>-<name>. Completed
+        files are recorded in destination/.manifest.jsonl, so running the export again
+        after an interruption skips the files already downloaded and fetches the rest.
+
+        Args:
+            employeeIds (Iterable[str]): Employee IDs, consumed lazily.
+            destination (str | PathLike): Export root directory, created when missing.
+            max_workers (int, optional): Number of concurrent downloads. Default is 8.
+            list_workers (int, optional): Number of concurrent listings. Default is 4.
+            verify (bool, optional): Also compare the SHA-256 of files recorded in the manifest before skipping them. Default is False.
+            chunk_size (int, optional): Bytes read and written at a time. Default is 1 MiB.
+
+        Yields:
+            BulkResult: key is the (employeeId, relative path) tuple and value a dict with path,
+                status (downloaded or skipped), size and sha256. Failed listings are yielded
+                last with a relative path of None.
+
+        Example:
+            for result in bob.documents.export_documents(ids, "audit-2024"):
+                if not result.ok:
+                    print(result.key, result.error)
+        """
+        require_sync(self.client, "Documents.export_documents")
+
+        destination = os.fspath(destination)
+        os.makedirs(destination, exist_ok=True)
+
+        journal = Journal(os.path.join(destination, ".manifest.jsonl"))
+        entries = journal.load()
+        failed_listings = []
+
+        listings = run_concurrently(
+            (
+                (employeeId, partial(self.download_documents, employeeId))
+                for employeeId in employeeIds
+            ),
+            max_workers=list_workers,
+        )
+
+        def downloads():
+            for listing in listings:
+                if not listing.ok:
+                    failed_listings.append(
+                        BulkResult(key=(listing.key, None), error=listing.error)
+                    )
+                    continue
+
+                for document in documents_of(listing.value):
+                    url = document_url(document)
+                    relative = document_path(listing.key, document)
+
+                    if url is None:
+                        continue
+
+                    yield (listing.key, relative), partial(
+                        export_document,
+                        self.client,
+                        journal,
+                        entries,
+                        url,
+                        destination,
+                        relative,
+                        verify=verify,
+                        chunk_size=chunk_size,
+                    )
+
+        yield from run_concurrently(downloads(), max_workers=max_workers)
+        yield from failed_listings
@@ -1,26 +1,30 @@
 from .base import BobEndpoint
+from functools import cached_property
 from typing import Optional, List
-from .models.Metadata import BobField
 
 
 class Metadata(BobEndpoint):
-    @property
+    @cached_property
     def lists(self):
         return Lists(self.client)
 
-    @property
+    @cached_property
     def fields(self):
         return Fields(self.client)
 
-    @property
+    @cached_property
     def tables(self):
         return Tables(self.client)
 
-    @property
+    @cached_property
     def positions(self):
         return Positions(self.client)
 
 
+# Company configuration changes rarely, so reads are served from client.cache and the
+# write methods invalidate the matching entries.
+
+
 class Lists(BobEndpoint):
     def get(
         self, listName: Optional[str] = None, includeArchived: Optional[bool] = None
@@ -41,7 +45,7 @@ class Lists(BobEndpoint):
             endpoint = f"company/named-lists/{listName}"
         if includeArchived:
             json_body["includeArchived"] = includeArchived
-        return self.client.get(endpoint, json_body=json_body)
+        return self.client.get(endpoint, json_body=json_body, cache=True)
 
     def add_item(
         self, listName: str, name: str, parentId: Optional[str] = None
@@ -63,7 +67,11 @@ class Lists(BobEndpoint):
         if parentId:
             json_body["parentId"] = parentId
 
-        return self.client.post(f"company/named-lists/{listName}", json_body=json_body)
+        response = self.client.post(
+            f"company/named-lists/{listName}", json_body=json_body
+        )
+
+        return self.client.invalidate_after(response, "company/named-lists")
 
     def update_item(
         self,
@@ -92,10 +100,12 @@ class Lists(BobEndpoint):
         if parentId:
             json_body["parentId"] = parentId
 
-        return self.client.put(
+        response = self.client.put(
             f"company/named-lists/{listName}/{itemId}", json_body=json_body
         )
 
+        return self.client.invalidate_after(response, "company/named-lists")
+
     def delete_item(self, listName: str, itemId: str):
         """
         Delete an existing list item
@@ -108,7 +118,9 @@ class Lists(BobEndpoint):
             200 response: The item was deleted successfully
             404 response: The item was not found
         """
-        return self.client.delete(f"company/named-lists/{listName}/{itemId}")
+        response = self.client.delete(f"company/named-lists/{listName}/{itemId}")
+
+        return self.client.invalidate_after(response, "company/named-lists")
 
 
 class Fields(BobEndpoint):
@@ -119,7 +131,7 @@ class Fields(BobEndpoint):
         Returns:
             List[dict]: A list of dictionaries
         """
-        return self.client.get("company/people/fields")
+        return self.client.get("company/people/fields", cache=True)
 
     def create_field(
         self,
@@ -144,6 +156,8 @@ class Fields(BobEndpoint):
             400 response: If the category of the field is root, or historical is set to true, but the category doesn't allow it, or if the field type is not supported.
             404 response: If the category of the field doesn't exist.
         """
+        from .models.Metadata import BobField
+
         json_body = {}
 
         field = BobField(
@@ -162,7 +176,9 @@ class Fields(BobEndpoint):
         if historical:
             json_body["historical"] = field.historical
 
-        return self.client.post("company/people/fields", json_body=json_body)
+        response = self.client.post("company/people/fields", json_body=json_body)
+
+        return self.client.invalidate_after(response, "company/people/fields")
 
     def update_field(
         self,
@@ -189,7 +205,11 @@ class Fields(BobEndpoint):
         if description:
             json_body["description"] = description
 
-        return self.client.put(f"company/people/fields/{fieldId}", json_body=json_body)
+        response = self.client.put(
+            f"company/people/fields/{fieldId}", json_body=json_body
+        )
+
+        return self.client.invalidate_after(response, "company/people/fields")
 
     def delete_field(self, fieldId: str):
         """
@@ -203,7 +223,9 @@ class Fields(BobEndpoint):
             400 response: If the field is a Bob default field
             404 response: The field was not found
         """
-        return self.client.delete(f"company/people/fields/{fieldId}")
+        response = self.client.delete(f"company/people/fields/{fieldId}")
+
+        return self.client.invalidate_after(response, "company/people/fields")
 
 
 class Tables(BobEndpoint):
@@ -217,7 +239,7 @@ class Tables(BobEndpoint):
         if custom_table_id:
             endpoint = f"people/custom-tables/metadata/{custom_table_id}"
 
-        return self.client.get(endpoint)
+        return self.client.get(endpoint, cache=True)
 
 
 class Positions(BobEndpoint):
@@ -228,4 +250,4 @@ class Positions(BobEndpoint):
         Returns:
             List[dict]: A list of dictionaries
         """
-        return self.client.get("metadata/objects/position")
+        return self.client.get("metadata/objects/position", cache=True)
@@ -1,12 +1,13 @@
 from .base import BobEndpoint
+from functools import cached_property
 
 
 class Onboarding(BobEndpoint):
-    @property
+    @cached_property
     def wizards(self):
         return Wizards(self.client)
 
 
 class Wizards(BobEndpoint):
     def get(self):
-        return self.client.get("onboarding/wizards")
+        return self.client.get("onboarding/wizards", cache=True)
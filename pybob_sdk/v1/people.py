@@ -1,27 +1,65 @@
 from .base import BobEndpoint
-from .models.People import (
-    SearchModel,
-    FilterModel,
-    HumanReadableValues,
-    TerminationReasonType,
-)
-from .models.Payroll import (
-    PayFrequency,
-    PayPeriod,
-    Base,
-    ExcercisePrice,
-    VariablePayPeriod,
-)
-from pydantic import ValidationError
-from typing import Optional, List
+from .bulk import BulkResult, require_sync, run_concurrently
+from .directory import PeopleDirectory
+from ..streaming import iter_json_array
+from typing import TYPE_CHECKING, Optional, List, Iterable, Iterator
+from functools import cached_property, partial
 import json
 
+# Models are imported where they are used, pydantic is only loaded when one is needed.
+if TYPE_CHECKING:
+    from .models.People import FilterModel
+
+HISTORY_KINDS = {
+    "work": "list_work_history",
+    "employment": "list_employment_history",
+    "lifecycle": "list_lifecycle_history",
+    "salaries": "list_salary_history",
+    "equities": "list_equity_grants",
+    "variable": "list_variable_payments",
+    "training": "list_training_records",
+}
+
+
+def search_body(
+    fields: Optional[List[str]] = None,
+    filters: Optional[List["FilterModel"]] = None,
+    showInactive: Optional[bool] = None,
+    humanReadable: Optional[str] = None,
+) -> dict:
+    from .models.People import SearchModel
+
+    if humanReadable:
+        humanReadable = humanReadable.lower()
+
+    search_parameters = SearchModel(
+        fields=fields,
+        filters=filters,
+        showInactive=showInactive,
+        humanReadable=humanReadable,
+    )
+
+    json_body = {}
+
+    if search_parameters.fields:
+        json_body["fields"] = search_parameters.fields
+    if search_parameters.filters:
+        json_body["filters"] = [
+            filter.model_dump() for filter in search_parameters.filters
+        ]
+    if search_parameters.showInactive:
+        json_body["showInactive"] = search_parameters.showInactive
+    if search_parameters.humanReadable:
+        json_body["humanReadable"] = search_parameters.humanReadable
+
+    return json_body
+
 
 class People(BobEndpoint):
     def search(
         self,
         fields: Optional[List[str]] = None,
-        filters: Optional[List[FilterModel]] = None,
+        filters: Optional[List["FilterModel"]] = None,
         showInactive: Optional[bool] = None,
         humanReadable: Optional[str] = None,
     ) -> List[dict]:
@@ -41,30 +79,41 @@ class People(BobEndpoint):
             https://apidocs.hibob.com/reference/post_people-search
         """
 
-        if humanReadable:
-            humanReadable = humanReadable.lower()
+        json_body = search_body(fields, filters, showInactive, humanReadable)
 
-        search_parameters = SearchModel(
-            fields=fields,
-            filters=filters,
-            showInactive=showInactive,
-            humanReadable=humanReadable,
-        )
+        return self.client.post("people/search", json_body=json_body)
 
-        json_body = {}
+    def search_iter(
+        self,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List["FilterModel"]] = None,
+        showInactive: Optional[bool] = None,
+        humanReadable: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[dict]:
+        """
+        Stream the people/search response and yield employees one at a time.
 
-        if search_parameters.fields:
-            json_body["fields"] = search_parameters.fields
-        if search_parameters.filters:
-            json_body["filters"] = [
-                filter.model_dump() for filter in search_parameters.filters
-            ]
-        if search_parameters.showInactive:
-            json_body["showInactive"] = search_parameters.showInactive
-        if search_parameters.humanReadable:
-            json_body["humanReadable"] = search_parameters.humanReadable
+        Takes the same arguments as search, but the response body is parsed incrementally
+        while it is downloaded, so memory use does not grow with the number of employees.
 
-        return self.client.post("people/search", json_body=json_body)
+        Args:
+            chunk_size (int, optional): Number of bytes read from the network at a time. Default is 65536.
+
+        Yields:
+            dict: One entry of the "employees" array.
+
+        References:
+            https://apidocs.hibob.com/reference/post_people-search
+        """
+        require_sync(self.client, "People.search_iter")
+
+        json_body = search_body(fields, filters, showInactive, humanReadable)
+
+        with self.client.stream(
+            "POST", "people/search", json_body=json_body
+        ) as response:
+            yield from iter_json_array(response.iter_content(chunk_size), "employees")
 
     def read(self, sortBy: Optional[str] = None):
         """
@@ -82,7 +131,31 @@ class People(BobEndpoint):
 
         return self.client.get("profiles", query={"sortBy": sortBy})
 
-    @property
+    def directory(
+        self,
+        fields: Optional[List[str]] = None,
+        index: Iterable[str] = (),
+        refresh_interval: float = 300.0,
+        database: Optional[str] = None,
+        showInactive: Optional[bool] = None,
+        retry_interval: float = 30.0,
+    ) -> PeopleDirectory:
+        """
+        Create a local, indexed replica of the company directory.
+
+        See PeopleDirectory for the arguments.
+        """
+        return PeopleDirectory(
+            self,
+            fields=fields,
+            index=index,
+            refresh_interval=refresh_interval,
+            database=database,
+            showInactive=showInactive,
+            retry_interval=retry_interval,
+        )
+
+    @cached_property
     def employee(self):
         return Employee(self.client)
 
@@ -107,6 +180,8 @@ class Employee(BobEndpoint):
         References:
             https://apidocs.hibob.com/reference#get_people-identifier
         """
+        from .models.People import HumanReadableValues
+
         json_body = {}
 
         if fields:
@@ -221,6 +296,8 @@ class Employee(BobEndpoint):
         References:
             https://apidocs.hibob.com/reference/post_people-identifier-terminate
         """
+        from .models.People import TerminationReasonType
+
         json_body = {}
 
         json_body["terminationDate"] = (terminationDate,)
@@ -679,6 +756,8 @@ class Employee(BobEndpoint):
         References:
             https://api.hibob.com/v1/people/{id}/salaries
         """
+        from .models.Payroll import Base, PayFrequency, PayPeriod
+
         json_body = {}
         json_body["effectiveDate"] = effectiveDate
         json_body["base"] = Base(
@@ -776,6 +855,8 @@ class Employee(BobEndpoint):
         References:
             https://apidocs.hibob.com/reference/post_people-id-equities
         """
+        from .models.Payroll import ExcercisePrice
+
         json_body = {}
 
         json_body["effectiveDate"] = effectiveDate
@@ -860,6 +941,8 @@ class Employee(BobEndpoint):
         References:
             https://apidocs.hibob.com/reference/put_people-id-equities-entry-id
         """
+        from .models.Payroll import ExcercisePrice
+
         json_body = {}
 
         json_body["effectiveDate"] = effectiveDate
@@ -963,6 +1046,8 @@ class Employee(BobEndpoint):
         References:
             https://apidocs.hibob.com/reference/post_people-id-variable
         """
+        from .models.Payroll import Base, VariablePayPeriod
+
         json_body = {}
         json_body["effectiveDate"] = effectiveDate
         json_body["amount"] = Base(
@@ -1054,6 +1139,8 @@ class Employee(BobEndpoint):
         References:
             https://apidocs.hibob.com/reference/post_people-id-training
         """
+        from .models.Payroll import Base
+
         json_body = {}
 
         json_body["effectiveDate"] = effectiveDate
@@ -1094,3 +1181,50 @@ class Employee(BobEndpoint):
             https://apidocs.hibob.com/reference/delete_people-id-training-entry-id
         """
         return self.client.delete(f"people/{employeeId}/training/{entryId}")
+
+    def bulk_history(
+        self,
+        employeeIds: Iterable[str],
+        kinds: Optional[List[str]] = None,
+        max_workers: int = 8,
+    ) -> Iterator[BulkResult]:
+        """
+        Fetch history tables for many employees concurrently.
+
+        Calls are made on a bounded thread pool and results are yielded as soon as they
+        complete. A failing call is reported on its BulkResult instead of aborting the batch.
+
+        Args:
+            employeeIds (Iterable[str]): Employee IDs, consumed lazily.
+            kinds (List[str], optional): History tables to fetch, any of: work, employment, lifecycle, salaries, equities, variable, training. Defaults to all.
+            max_workers (int, optional): Number of concurrent requests. Default is 8.
+
+        Yields:
+            BulkResult: key is the (employeeId, kind) tuple, value the endpoint response.
+
+        Example:
+            for result in bob.people.employee.bulk_history(ids, kinds=["salaries"]):
+                if result.ok:
+                    employeeId, kind = result.key
+                    ...
+        """
+        require_sync(self.client, "Employee.bulk_history")
+
+        kinds = list(kinds or HISTORY_KINDS)
+
+        for kind in kinds:
+            if kind not in HISTORY_KINDS:
+                raise ValueError(
+                    f"Unknown history kind {kind!r}, expected one of {list(HISTORY_KINDS)}"
+                )
+
+        calls = (
+            (
+                (employeeId, kind),
+                partial(getattr(self, HISTORY_KINDS[kind]), employeeId),
+            )
+            for employeeId in employeeIds
+            for kind in kinds
+        )
+
+        return run_concurrently(calls, max_workers=max_workers)
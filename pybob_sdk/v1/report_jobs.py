@@ -0,0 +1,220 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from ..streaming import content_length, iter_body, write_stream
+
+log = logging.getLogger("py-bob")
+
+_pollers = weakref.WeakKeyDictionary()
+_pollers_lock = threading.Lock()
+
+
+class ReportJob:
+    def __init__(
+        self,
+        url: str,
+        sink: Any,
+        chunk_size: int,
+        interval: float,
+        deadline: float,
+        decompress: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+    ):
+        self.url = url
+        self.sink = sink
+        self.chunk_size = chunk_size
+        self.decompress = decompress
+        self.progress = progress
+        self.interval = interval
+        self.deadline = deadline
+        self.future = Future()
+
+
+class ReportPoller:
+    def __init__(
+        self,
+        client,
+        max_workers: int = 4,
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        timeout: float = 900.0,
+    ):
+        """
+        Shared scheduler polling asynchronous report downloads until they are ready.
+
+        A single scheduler thread keeps every pending job in a heap ordered by its next poll
+        time, and hands due polls to a small worker pool. Each job backs off exponentially
+        between polls, and once Bob answers 200 the report is streamed to its sink by the
+        worker, so many exports can be waited on concurrently with a handful of threads.
+        The scheduler thread exits once no job is pending, and close() stops the poller.
+
+        Args:
+            client (BobClient): Client used to poll and download.
+            max_workers (int, optional): Number of concurrent polls/downloads. Default is 4.
+            interval (float, optional): Seconds before the first poll, doubled after each 204. Default is 1.
+            max_interval (float, optional): Upper bound for the poll interval. Default is 30.
+            timeout (float, optional): Seconds after which a job fails with TimeoutError. Default is 900.
+        """
+        # Weak, so the poller kept in _pollers does not keep its client alive.
+        self._client = weakref.ref(client)
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bob-reports"
+        )
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    @property
+    def client(self):
+        return self._client()
+
+    @classmethod
+    def for_client(cls, client) -> "ReportPoller":
+        """
+        Return the poller shared by every Reports endpoint of client.
+        """
+        with _pollers_lock:
+            poller = _pollers.get(client)
+            if poller is None:
+                poller = _pollers[client] = cls(client)
+            return poller
+
+    @classmethod
+    def close_for_client(cls, client):
+        """
+        Close the poller shared by the Reports endpoints of client, if one was created.
+        """
+        with _pollers_lock:
+            poller = _pollers.pop(client, None)
+
+        if poller is not None:
+            poller.close()
+
+    def close(self):
+        """
+        Stop polling, cancel the jobs waiting for their next poll and release the threads.
+
+        Downloads already running are completed.
+        """
+        with self._condition:
+            self._closed = True
+            jobs = [job for _, _, job in self._queue]
+            self._queue.clear()
+            self._condition.notify_all()
+
+        for job in jobs:
+            job.future.cancel()
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(
+        self,
+        url: str,
+        sink: Any,
+        chunk_size: int = 1 << 20,
+        decompress: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+    ) -> Future:
+        """
+        Poll url until the report is ready and stream it to sink.
+
+        Args:
+            url (str): Polling URL returned by Reports.get_report_download_url.
+            sink (str | PathLike | BinaryIO): Destination path or binary file-like object.
+            chunk_size (int, optional): Bytes written at a time. Default is 1 MiB.
+            decompress (bool, optional): See streaming.iter_body. Default is True.
+            progress (Callable, optional): Called as progress(written, total) while writing.
+
+        Returns:
+            Future: Resolves to sink once the report has been written.
+        """
+        job = ReportJob(
+            url,
+            sink,
+            chunk_size,
+            self.interval,
+            time.monotonic() + self.timeout,
+            decompress=decompress,
+            progress=progress,
+        )
+        self._schedule(job, self.interval)
+        return job.future
+
+    def _schedule(self, job: ReportJob, delay: float):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ReportPoller is closed")
+
+            heapq.heappush(
+                self._queue, (time.monotonic() + delay, next(self._counter), job)
+            )
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="bob-report-poller", daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._closed or not self._queue:
+                    # Restarted by _schedule, so an idle poller holds no thread.
+                    self._thread = None
+                    return
+
+                due, _, job = self._queue[0]
+                wait = due - time.monotonic()
+
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+
+                heapq.heappop(self._queue)
+
+            try:
+                self.executor.submit(self._poll, job)
+            except RuntimeError:
+                # Closed since the job was taken from the queue.
+                job.future.cancel()
+                return
+
+    def _poll(self, job: ReportJob):
+        if job.future.cancelled():
+            return
+
+        try:
+            with self.client.stream("GET", job.url) as response:
+                if response.status_code == 200:
+                    if not job.future.set_running_or_notify_cancel():
+                        return
+                    write_stream(
+                        iter_body(response, job.chunk_size, job.decompress),
+                        job.sink,
+                        job.progress,
+                        content_length(response, job.decompress),
+                    )
+                    job.future.set_result(job.sink)
+                    return
+
+            if time.monotonic() >= job.deadline:
+                raise TimeoutError(f"Report {job.url} was not ready in time")
+
+            job.interval = min(job.interval * 2, self.max_interval)
+            log.debug(f"Report {job.url} not ready, polling again in {job.interval}s")
+            self._schedule(job, job.interval)
+        except BaseException as error:
+            job.future.set_exception(error)
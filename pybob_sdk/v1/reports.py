@@ -1,6 +1,11 @@
 from .base import BobEndpoint
 from .models.Reports import ReportFormat
-from typing import Optional
+from .bulk import require_sync
+from .report_jobs import ReportPoller
+from .csv_rows import iter_lines, iter_typed_rows
+from ..streaming import content_length, iter_body, write_stream
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
 
 
 class Reports(BobEndpoint):
@@ -56,6 +61,121 @@ class Reports(BobEndpoint):
 
         return self.client.get(f"company/reports/{reportId}/download", query=query)
 
+    def download_to(
+        self,
+        reportId: int,
+        format: str,
+        destination: Any,
+        includeInfo: Optional[bool] = False,
+        locale: Optional[str] = None,
+        humanReadable: Optional[str] = None,
+        chunk_size: int = 1 << 20,
+        decompress: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+    ) -> int:
+        """
+        Download the report by ID straight to a file, without holding it in memory.
+
+        Takes the same report arguments as download, but the response is streamed to
+        destination in chunks of chunk_size bytes instead of being returned as a str.
+
+        Args:
+            destination (str | PathLike | BinaryIO): Path or binary file-like object the report is written to.
+            chunk_size (int, optional): Bytes read and written at a time. Default is 1 MiB.
+            decompress (bool, optional): Decompress gzip encoded responses on the fly. When False the bytes are written as received. Default is True.
+            progress (Callable, optional): Called as progress(written, total) after every chunk, total is None when unknown.
+
+        Returns:
+            int: Number of bytes written.
+
+        References:
+            https://apidocs.hibob.com/reference/get_company-reports-reportid-download
+        """
+        require_sync(self.client, "Reports.download_to")
+
+        query = {}
+
+        query["format"] = ReportFormat(format).value
+
+        if includeInfo:
+            query["includeInfo"] = includeInfo
+        if locale:
+            query["locale"] = locale
+        if humanReadable:
+            query["humanReadable"] = humanReadable
+
+        with self.client.stream(
+            "GET", f"company/reports/{reportId}/download", query=query
+        ) as response:
+            return write_stream(
+                iter_body(response, chunk_size, decompress),
+                destination,
+                progress,
+                content_length(response, decompress),
+            )
+
+    def iter_csv(
+        self,
+        reportId: int,
+        includeInfo: Optional[bool] = False,
+        locale: Optional[str] = None,
+        column_types: Optional[Dict[str, str]] = None,
+        field_metadata: Optional[Iterable[dict]] = None,
+        date_format: Optional[str] = None,
+        strict: bool = False,
+        chunk_size: int = 1 << 16,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Download the report by ID as CSV and yield typed rows while it is being received.
+
+        The CSV is parsed row by row from the network stream, so exports of any size can
+        be loaded without holding the file in memory. Date, number and currency columns
+        are converted to date, int/float and Decimal values.
+
+        Args:
+            reportId (int): The ID of the report to download.
+            includeInfo (bool, optional): Whether to include additional information in the report. Default is False.
+            locale (str, optional): The requested language for the report columns in the format of locale (e.g. fr-FR).
+            column_types (Dict[str, str], optional): Field type per column header, one of date, number or currency. Overrides field_metadata.
+            field_metadata (Iterable[dict], optional): Output of Metadata.fields.get(), used to type the columns by field name.
+            date_format (str, optional): strptime format of non ISO dates, e.g. "%d/%m/%Y".
+            strict (bool, optional): Raise ValueError on values not matching their column type instead of keeping them as str. Default is False.
+            chunk_size (int, optional): Bytes read from the network at a time. Default is 64 KiB.
+
+        Yields:
+            dict: One row keyed by column header, empty cells are None.
+
+        References:
+            https://apidocs.hibob.com/reference/get_company-reports-reportid-download
+        """
+        require_sync(self.client, "Reports.iter_csv")
+
+        query = {}
+
+        query["format"] = ReportFormat.CSV.value
+
+        if includeInfo:
+            query["includeInfo"] = includeInfo
+        if locale:
+            query["locale"] = locale
+
+        types = {
+            field["name"]: field.get("type")
+            for field in field_metadata or []
+            if field.get("name")
+        }
+        types.update(column_types or {})
+
+        with self.client.stream(
+            "GET", f"company/reports/{reportId}/download", query=query
+        ) as response:
+            yield from iter_typed_rows(
+                iter_lines(iter_body(response, chunk_size)),
+                column_types=types,
+                date_format=date_format,
+                strict=strict,
+            )
+
     def get_report_download_url(
         self,
         reportId: int,
@@ -91,11 +211,11 @@ class Reports(BobEndpoint):
         if humanReadable:
             query["humanReadable"] = humanReadable
 
-        response = self.client.get(
-            f"company/reports/{reportId}/download-async", query=query
+        headers = self.client.request_headers(
+            "GET", f"company/reports/{reportId}/download-async", query=query
         )
 
-        return response.headers.get("Location")
+        return self.client.then(headers, lambda headers: headers.get("Location"))
 
     def download_report_by_url(self, reportName: str):
         """
@@ -113,3 +233,76 @@ class Reports(BobEndpoint):
         """
 
         return self.client.get(f"company/reports/download/{reportName}")
+
+    def download_async(
+        self,
+        reportId: int,
+        format: str,
+        destination: Any,
+        includeInfo: bool = False,
+        locale: Optional[str] = None,
+        humanReadable: Optional[str] = None,
+        poller: Optional[ReportPoller] = None,
+        chunk_size: int = 1 << 20,
+        decompress: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], Any]] = None,
+    ) -> Future:
+        """
+        Start a report export and download it in the background once it is ready.
+
+        The export is started with get_report_download_url, then its polling URL is handed
+        to a ReportPoller which polls with exponential backoff and streams the file to
+        destination in chunks. Every job of a client shares the same poller, so many
+        reports can be exported in parallel.
+
+        Args:
+            reportId (int): The ID of the report.
+            format (str): The file format of the report.
+            destination (str | PathLike | BinaryIO): Path or binary file-like object the report is written to.
+            includeInfo (bool, optional): Whether to include additional information in the report. Default is False.
+            locale (str, optional): The requested language for the report columns in the format of the locale (e.g. fr-FR).
+            humanReadable (str, optional): Only enforced when format is json. Possible values: APPEND, REPLACE
+            poller (ReportPoller, optional): Poller to use instead of the client's shared one.
+            chunk_size, decompress, progress: See download_to.
+
+        Returns:
+            Future: Resolves to destination once the report has been written.
+
+        Raises:
+            ValueError: When Bob answers without a polling URL.
+            TypeError: With AsyncBob, await get_report_download_url and poll the URL with download_report_by_url instead.
+
+        Example:
+            jobs = [
+                bob.reports.download_async(reportId, "csv", f"{reportId}.csv")
+                for reportId in reportIds
+            ]
+            for job in jobs:
+                job.result()
+
+        References:
+            https://apidocs.hibob.com/reference/get_company-reports-reportid-download-async
+        """
+        require_sync(self.client, "Reports.download_async")
+
+        url = self.get_report_download_url(
+            reportId,
+            ReportFormat(format).value,
+            includeInfo=includeInfo,
+            locale=locale,
+            humanReadable=humanReadable,
+        )
+
+        if not url:
+            raise ValueError(f"Bob returned no polling URL for report {reportId}")
+
+        if poller is None:
+            poller = ReportPoller.for_client(self.client)
+
+        return poller.submit(
+            url,
+            destination,
+            chunk_size=chunk_size,
+            decompress=decompress,
+            progress=progress,
+        )
@@ -1,6 +1,34 @@
 from .base import BobEndpoint
-from .models.Tasks import Task
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, List
+
+if TYPE_CHECKING:
+    from .models.Tasks import Task
+
+
+def parse_tasks(response: dict) -> List["Task"]:
+    from .models.Tasks import Task
+
+    tasks = [
+        Task(
+            id=task["id"],
+            owner=task["owner"],
+            title=task["title"],
+            requestedFor=task["requestedFor"],
+            due=task["due"],
+            linkInBob=task["linkInBob"],
+            set=task["set"],
+            workflow=task["workflow"],
+            ordinalInWorkflow=task["ordinalInWorkflow"],
+            description=task["description"],
+            status=task["status"],
+            completionDate=task["completionDate"],
+            employeeGroupId=task["employeeGroupId"],
+            companyId=task["companyId"],
+        )
+        for task in response["tasks"]
+    ]
+
+    return tasks
 
 
 class Tasks(BobEndpoint):
@@ -13,27 +41,7 @@ class Tasks(BobEndpoint):
         """
         response = self.client.get("tasks")
 
-        tasks = [
-            Task(
-                id=task["id"],
-                owner=task["owner"],
-                title=task["title"],
-                requestedFor=task["requestedFor"],
-                due=task["due"],
-                linkInBob=task["linkInBob"],
-                set=task["set"],
-                workflow=task["workflow"],
-                ordinalInWorkflow=task["ordinalInWorkflow"],
-                description=task["description"],
-                status=task["status"],
-                completionDate=task["completionDate"],
-                employeeGroupId=task["employeeGroupId"],
-                companyId=task["companyId"],
-            )
-            for task in response["tasks"]
-        ]
-
-        return tasks
+        return self.client.then(response, parse_tasks)
 
     def read_specific_employee(self, employeeId: str, taskStatus: Optional[str] = None):
         """
@@ -53,27 +61,7 @@ class Tasks(BobEndpoint):
 
         response = self.client.get(f"tasks/people/{employeeId}", query=query)
 
-        tasks = [
-            Task(
-                id=task["id"],
-                owner=task["owner"],
-                title=task["title"],
-                requestedFor=task["requestedFor"],
-                due=task["due"],
-                linkInBob=task["linkInBob"],
-                set=task["set"],
-                workflow=task["workflow"],
-                ordinalInWorkflow=task["ordinalInWorkflow"],
-                description=task["description"],
-                status=task["status"],
-                completionDate=task["completionDate"],
-                employeeGroupId=task["employeeGroupId"],
-                companyId=task["companyId"],
-            )
-            for task in response["tasks"]
-        ]
-
-        return tasks
+        return self.client.then(response, parse_tasks)
 
     def mark_task_complete(self, task_id: str):
         """
@@ -1,5 +1,12 @@
 from .base import BobEndpoint
-from typing import Optional, List
+from .bulk import require_sync, run_concurrently
+from .timeoff_import import TimeOffImporter
+from .timeoff_sync import TimeOffSync
+from .whosout import WhosOutCache
+from ..cache import MISSING, TTLCache
+from datetime import timedelta
+from functools import partial
+from typing import Dict, Iterable, Optional, List
 
 
 class TimeOff(BobEndpoint):
@@ -159,6 +166,21 @@ class TimeOff(BobEndpoint):
             f"timeoff/employees/{employeeId}/diffHours/requests", json_body=json_body
         )
 
+    def batch_submitter(
+        self,
+        journal: str,
+        max_workers: int = 8,
+        resubmitUnknown: bool = False,
+    ) -> TimeOffImporter:
+        """
+        Create a validating, concurrent and resumable submitter of time off requests.
+
+        See TimeOffImporter for the arguments.
+        """
+        return TimeOffImporter(
+            self, journal, max_workers=max_workers, resubmitUnknown=resubmitUnknown
+        )
+
     def get_request_details(self, employeeId: str, requestId: int):
         """
         Get the details of an existing timeoff request.
@@ -219,6 +241,26 @@ class TimeOff(BobEndpoint):
 
         return self.client.get("timeoff/requests/changes", query=query)
 
+    def change_feed(
+        self,
+        database: str,
+        initialSince: Optional[str] = None,
+        overlap: timedelta = timedelta(minutes=5),
+        includePending: Optional[bool] = None,
+    ) -> TimeOffSync:
+        """
+        Create an incremental, checkpointed replica of time off requests in SQLite.
+
+        See TimeOffSync for the arguments.
+        """
+        return TimeOffSync(
+            self,
+            database,
+            initialSince=initialSince,
+            overlap=overlap,
+            includePending=includePending,
+        )
+
     def get_whos_out_of_office(
         self,
         fromDate: str,
@@ -257,6 +299,26 @@ class TimeOff(BobEndpoint):
 
         return self.client.get("timeoff/whosout", query=query)
 
+    def whos_out_cache(
+        self,
+        includeHourly: Optional[bool] = None,
+        includePrivate: Optional[bool] = None,
+        includePending: Optional[bool] = None,
+        max_age: Optional[float] = 3600.0,
+    ) -> WhosOutCache:
+        """
+        Create a local interval index answering who's out queries for covered ranges.
+
+        See WhosOutCache for the arguments.
+        """
+        return WhosOutCache(
+            self,
+            includeHourly=includeHourly,
+            includePrivate=includePrivate,
+            includePending=includePending,
+            max_age=max_age,
+        )
+
     def get_whos_out_of_office_today(
         self,
         includeHourly: Optional[bool] = None,
@@ -304,7 +366,9 @@ class TimeOff(BobEndpoint):
         Reference:
             https://apidocs.hibob.com/reference/get_timeoff-policy-types-policytype-reason-codes
         """
-        return self.client.get(f"timeoff/policy-types/{policyType}/reason-codes")
+        return self.client.get(
+            f"timeoff/policy-types/{policyType}/reason-codes", cache=True
+        )
 
     def add_reason_codes(self, policyType: str, reasonCodes: List[str]):
         """
@@ -327,10 +391,12 @@ class TimeOff(BobEndpoint):
 
         json_body["reasonCodes"] = reasonCodes
 
-        return self.client.post(
+        response = self.client.post(
             f"timeoff/policy-types/{policyType}/reason-codes", json_body=json_body
         )
 
+        return self.client.invalidate_after(response, "timeoff/policy-types")
+
     def get_policy_type_details(self, policyType: str):
         """
         Get details about a given policy type.
@@ -359,7 +425,7 @@ class TimeOff(BobEndpoint):
         Reference:
             https://apidocs.hibob.com/reference/get_timeoff-policy-types
         """
-        return self.client.get("timeoff/policy-types")
+        return self.client.get("timeoff/policy-types", cache=True)
 
     def get_policy_details(self, policyName: str):
         """
@@ -423,6 +489,76 @@ class TimeOff(BobEndpoint):
 
         return self.client.get(f"timeoff/employees/{employeeId}/balance", query=query)
 
+    def bulk_balances(
+        self,
+        employees: Iterable[str],
+        policyTypes: Iterable[str],
+        dates: Iterable[str],
+        max_workers: int = 8,
+        cache: Optional[TTLCache] = None,
+    ) -> Dict[str, list]:
+        """
+        Get balances for every (employee, policy type, date) combination concurrently.
+
+        Duplicate combinations are requested once. When a cache is given, balances found
+        in it are not requested again and fetched ones are stored in it, so successive
+        reports sharing a TTLCache only fetch what they have not seen. A failing
+        combination is reported in the error column instead of aborting the batch.
+
+        Args:
+            employees (Iterable[str]): Employee IDs.
+            policyTypes (Iterable[str]): Policy type names.
+            dates (Iterable[str]): Points in time, e.g. "2024-01-31".
+            max_workers (int, optional): Number of concurrent requests. Default is 8.
+            cache (TTLCache, optional): Cache of balances reused across calls.
+
+        Returns:
+            Dict[str, list]: Columns employeeId, policyType, date, balance and error, one row per combination.
+
+        Reference:
+            https://apidocs.hibob.com/reference/get_timeoff-employees-id-balance
+        """
+        require_sync(self.client, "TimeOff.bulk_balances")
+
+        policyTypes = list(dict.fromkeys(policyTypes))
+        dates = list(dict.fromkeys(dates))
+        table = {
+            "employeeId": [],
+            "policyType": [],
+            "date": [],
+            "balance": [],
+            "error": [],
+        }
+
+        def add_row(key, balance=None, error=None):
+            table["employeeId"].append(key[0])
+            table["policyType"].append(key[1])
+            table["date"].append(key[2])
+            table["balance"].append(balance)
+            table["error"].append(error)
+
+        def uncached():
+            for employeeId in dict.fromkeys(employees):
+                for policyType in policyTypes:
+                    for date in dates:
+                        key = (employeeId, policyType, date)
+                        balance = MISSING if cache is None else cache.get(repr(key))
+
+                        if balance is MISSING:
+                            yield key, partial(
+                                self.get_employee_balance, employeeId, policyType, date
+                            )
+                        else:
+                            add_row(key, balance)
+
+        for result in run_concurrently(uncached(), max_workers=max_workers):
+            add_row(result.key, result.value, result.error)
+
+            if cache is not None and result.ok:
+                cache.set(repr(result.key), result.value)
+
+        return table
+
     def create_balance_adjustment(
         self,
         employeeId: str,
@@ -0,0 +1,210 @@
+import hashlib
+import inspect
+import json
+import logging
+from typing import Iterable, List, Set
+
+from .bulk import Journal, require_sync, run_concurrently
+
+log = logging.getLogger("py-bob")
+
+REQUIRED_FIELDS = ("employeeId", "policyType", "startDate")
+
+
+def payload_key(payload: dict) -> str:
+    """
+    Stable identifier of a request payload, used to recognise it across runs.
+    """
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def names_of(response) -> Set[str]:
+    """
+    Collect the names or ids listed in a policy type or reason code response.
+    """
+    if isinstance(response, dict):
+        response = next(
+            (value for value in response.values() if isinstance(value, list)), []
+        )
+
+    names = set()
+
+    for item in response or []:
+        if isinstance(item, dict):
+            names.update(
+                str(item[field]) for field in ("id", "name") if item.get(field)
+            )
+        else:
+            names.add(str(item))
+
+    return names
+
+
+def rejected(error: BaseException) -> bool:
+    """
+    Whether Bob answered with a client error, so the request was certainly not created.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status is not None and 400 <= status < 500
+
+
+class TimeOffImporter:
+    def __init__(
+        self,
+        timeOff,
+        journal: str,
+        max_workers: int = 8,
+        resubmitUnknown: bool = False,
+    ):
+        """
+        Validated, concurrent and resumable submission of many time off requests.
+
+        Payloads are the keyword arguments of TimeOff.new_request, or of
+        TimeOff.new_diff_hours_request when they carry durations. All of them are checked
+        against the company's policy types and reason codes before anything is sent, then
+        they are submitted on a bounded thread pool, relying on the client's retry policy
+        for throttled requests.
+
+        Progress is written to a JSON lines journal, so running the same payloads again
+        after a crash skips the ones already created. A payload that was sent but whose
+        outcome is not known (a crash, a timeout or a server error) is not sent again
+        unless resubmitUnknown is True, since Bob may have created it.
+
+        Args:
+            timeOff (TimeOff): TimeOff endpoint used to validate and submit.
+            journal (str): Path of the progress journal, created when missing.
+            max_workers (int, optional): Number of concurrent submissions. Default is 8.
+            resubmitUnknown (bool, optional): Also send payloads with an unknown outcome. Default is False.
+
+        Example:
+            importer = bob.time_off.batch_submitter("leave-import.jsonl")
+            summary = importer.submit(
+                [
+                    {"employeeId": "123", "policyType": "Holiday", "startDate": "2023-08-01", "endDate": "2023-08-04"},
+                    {"employeeId": "456", "policyType": "Sick", "startDate": "2023-09-12", "endDate": "2023-09-12"},
+                ]
+            )
+        """
+        require_sync(timeOff.client, "TimeOffImporter")
+
+        self.timeOff = timeOff
+        self.journal = Journal(journal)
+        self.max_workers = max_workers
+        self.resubmitUnknown = resubmitUnknown
+
+    def validate(self, payloads: Iterable[dict]) -> List[str]:
+        """
+        Check payloads locally and return one message per problem found.
+
+        Policy types and reason codes are read once through the client cache.
+        """
+        policy_types = names_of(self.timeOff.get_policy_types())
+        reason_codes = {}
+        problems = []
+
+        for index, payload in enumerate(payloads):
+            missing = [field for field in REQUIRED_FIELDS if not payload.get(field)]
+            if missing:
+                problems.append(f"Payload {index}: missing {', '.join(missing)}")
+                continue
+
+            method = self._method(payload)
+            unexpected = set(payload) - set(inspect.signature(method).parameters)
+            if unexpected:
+                problems.append(
+                    f"Payload {index}: unexpected {', '.join(sorted(unexpected))} "
+                    f"for {method.__name__}"
+                )
+                continue
+
+            policy_type = payload["policyType"]
+
+            if policy_type not in policy_types:
+                problems.append(f"Payload {index}: unknown policy type {policy_type!r}")
+                continue
+
+            if "durations" in payload:
+                if not payload.get("endDate"):
+                    problems.append(f"Payload {index}: durations require an endDate")
+                if not all(
+                    isinstance(duration, dict) and duration.get("date")
+                    for duration in payload["durations"] or []
+                ):
+                    problems.append(f"Payload {index}: every duration needs a date")
+
+            if payload.get("reasonCode") is not None:
+                if policy_type not in reason_codes:
+                    reason_codes[policy_type] = names_of(
+                        self.timeOff.get_policy_type_reason_codes(policy_type)
+                    )
+                if str(payload["reasonCode"]) not in reason_codes[policy_type]:
+                    problems.append(
+                        f"Payload {index}: unknown reason code "
+                        f"{payload['reasonCode']!r} for {policy_type!r}"
+                    )
+
+        return problems
+
+    def submit(self, payloads: Iterable[dict]) -> dict:
+        """
+        Validate then submit payloads, skipping those already created by a previous run.
+
+        Raises:
+            ValueError: When validation fails, nothing is submitted in that case.
+
+        Returns:
+            dict: {"submitted", "skipped", "failed", "unknown"} where failed maps payload
+                keys to their error and unknown lists the keys whose outcome is unknown.
+        """
+        payloads = list(payloads)
+        problems = self.validate(payloads)
+
+        if problems:
+            raise ValueError(
+                f"{len(problems)} invalid time off payloads:\n" + "\n".join(problems)
+            )
+
+        journalled = self.journal.load()
+        summary = {"submitted": 0, "skipped": 0, "failed": {}, "unknown": []}
+
+        def calls():
+            for payload in payloads:
+                key = payload_key(payload)
+                status = journalled.get(key, {}).get("status")
+
+                if status == "done":
+                    summary["skipped"] += 1
+                elif status in ("started", "unknown") and not self.resubmitUnknown:
+                    summary["unknown"].append(key)
+                else:
+                    yield key, lambda key=key, payload=payload: self._send(key, payload)
+
+        for result in run_concurrently(calls(), max_workers=self.max_workers):
+            if result.ok:
+                self.journal.record(result.key, "done", response=result.value)
+                summary["submitted"] += 1
+            elif rejected(result.error):
+                self.journal.record(result.key, "failed", error=repr(result.error))
+                summary["failed"][result.key] = result.error
+            else:
+                self.journal.record(result.key, "unknown", error=repr(result.error))
+                summary["unknown"].append(result.key)
+
+        log.debug(
+            f"Submitted {summary['submitted']} time off requests, skipped "
+            f"{summary['skipped']}, {len(summary['failed'])} failed, "
+            f"{len(summary['unknown'])} unknown"
+        )
+
+        return summary
+
+    def _send(self, key: str, payload: dict):
+        self.journal.record(key, "started")
+        return self._method(payload)(**payload)
+
+    def _method(self, payload: dict):
+        if "durations" in payload:
+            return self.timeOff.new_diff_hours_request
+        return self.timeOff.new_request
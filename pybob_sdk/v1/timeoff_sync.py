@@ -0,0 +1,199 @@
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from .bulk import require_sync
+
+log = logging.getLogger("py-bob")
+
+
+def format_timestamp(moment: datetime) -> str:
+    """
+    Format as the millisecond precision UTC timestamp used by the Bob API.
+    """
+    moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat(timespec="milliseconds") + "Z"
+
+
+def parse_timestamp(value: str) -> datetime:
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+class TimeOffSync:
+    def __init__(
+        self,
+        timeOff,
+        database: str,
+        initialSince: Optional[str] = None,
+        overlap: timedelta = timedelta(minutes=5),
+        includePending: Optional[bool] = None,
+    ):
+        """
+        Incremental replica of time off requests fed by TimeOff.get_requests_since_date.
+
+        Every sync() reads the changes made since the stored watermark, applies them to a
+        SQLite store and moves the watermark forward in the same transaction. Windows are
+        started overlap earlier than the watermark so changes committed late on Bob's side
+        are not missed; re-applying a change is harmless since requests are upserted by id.
+
+        Args:
+            timeOff (TimeOff): TimeOff endpoint used to read the changes.
+            database (str): SQLite database path holding the requests and the watermark.
+            initialSince (str, optional): Timestamp of the first sync when no watermark is stored, e.g. "2024-01-01T00:00:00.000Z".
+            overlap (timedelta, optional): How far before the watermark each window starts. Default is 5 minutes.
+            includePending (bool, optional): Whether to include pending requests.
+
+        Example:
+            feed = bob.time_off.change_feed("timeoff.db", initialSince="2024-01-01T00:00:00.000Z")
+            feed.sync()
+            requests = feed.requests(employeeId="123456789")
+        """
+        require_sync(timeOff.client, "TimeOffSync")
+
+        self.timeOff = timeOff
+        self.database = database
+        self.initialSince = initialSince
+        self.overlap = overlap
+        self.includePending = includePending
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS timeoff_requests ("
+                "request_id INTEGER PRIMARY KEY, employee_id TEXT, start_date TEXT, "
+                "end_date TEXT, deleted INTEGER NOT NULL DEFAULT 0, data TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS timeoff_requests_employee "
+                "ON timeoff_requests (employee_id, start_date)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS timeoff_sync "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), watermark TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.database)
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """
+        Timestamp up to which changes have been applied, None before the first sync.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT watermark FROM timeoff_sync WHERE id = 0"
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def sync(self) -> dict:
+        """
+        Apply the changes made since the last run.
+
+        Returns:
+            dict: {"since", "watermark", "created", "deleted"} describing the applied window.
+
+        Raises:
+            ValueError: When the response holds no changes list, the watermark is kept.
+        """
+        watermark = self.watermark
+
+        if watermark is not None:
+            since = format_timestamp(parse_timestamp(watermark) - self.overlap)
+        elif self.initialSince is not None:
+            since = self.initialSince
+        else:
+            raise ValueError("initialSince is required for the first sync")
+
+        # Taken before the request, so changes made while it runs fall in the next window.
+        started = format_timestamp(datetime.now(timezone.utc))
+        response = self.timeOff.get_requests_since_date(
+            since, includePending=self.includePending
+        )
+        changes = response.get("changes") if isinstance(response, dict) else None
+
+        if not isinstance(changes, list):
+            raise ValueError(
+                f"Expected a changes list from timeoff/requests/changes, got {response!r:.200}"
+            )
+
+        created = deleted = 0
+
+        with closing(self._connect()) as connection, connection:
+            for change in changes:
+                if change.get("changeType") == "Deleted":
+                    deleted += 1
+                    is_deleted = 1
+                else:
+                    created += 1
+                    is_deleted = 0
+
+                connection.execute(
+                    "INSERT INTO timeoff_requests "
+                    "(request_id, employee_id, start_date, end_date, deleted, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (request_id) DO UPDATE SET "
+                    "employee_id = coalesce(excluded.employee_id, employee_id), "
+                    "start_date = coalesce(excluded.start_date, start_date), "
+                    "end_date = coalesce(excluded.end_date, end_date), "
+                    "deleted = excluded.deleted, data = excluded.data",
+                    (
+                        change["requestId"],
+                        change.get("employeeId"),
+                        change.get("startDate"),
+                        change.get("endDate"),
+                        is_deleted,
+                        json.dumps(change),
+                    ),
+                )
+
+            connection.execute(
+                "INSERT OR REPLACE INTO timeoff_sync (id, watermark) VALUES (0, ?)",
+                (started,),
+            )
+
+        log.debug(
+            f"Applied {created} created and {deleted} deleted time off requests since {since}"
+        )
+
+        return {
+            "since": since,
+            "watermark": started,
+            "created": created,
+            "deleted": deleted,
+        }
+
+    def requests(
+        self,
+        employeeId: Optional[str] = None,
+        includeDeleted: bool = False,
+    ) -> List[dict]:
+        """
+        Read the replicated requests, optionally for a single employee.
+
+        Args:
+            employeeId (str, optional): Only return this employee's requests.
+            includeDeleted (bool, optional): Also return requests whose last change was a deletion. Default is False.
+        """
+        query = "SELECT data FROM timeoff_requests WHERE 1 = 1"
+        parameters = []
+
+        if employeeId is not None:
+            query += " AND employee_id = ?"
+            parameters.append(employeeId)
+        if not includeDeleted:
+            query += " AND deleted = 0"
+
+        with closing(self._connect()) as connection:
+            return [
+                json.loads(data)
+                for (data,) in connection.execute(
+                    query + " ORDER BY start_date", parameters
+                )
+            ]
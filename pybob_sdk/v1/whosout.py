@@ -0,0 +1,217 @@
+import bisect
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Hashable, List, Optional, Tuple, Union
+
+from .bulk import require_sync
+
+DateLike = Union[str, date]
+
+ONE_DAY = timedelta(days=1)
+
+
+def as_date(value: DateLike) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+class IntervalIndex:
+    def __init__(self):
+        """
+        Inclusive [start, end] intervals answering overlap queries.
+
+        Intervals are kept sorted by start and the longest span is tracked, so a query
+        only scans intervals starting between (query start - longest span) and query end.
+        Leave is short compared to the calendar, which keeps that window small.
+        """
+        self._starts: List[date] = []
+        self._entries: List[Tuple[date, date, Any]] = []
+        self._longest = timedelta(0)
+
+    def add(self, start: date, end: date, item: Any):
+        position = bisect.bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._entries.insert(position, (start, end, item))
+        self._longest = max(self._longest, end - start)
+
+    def overlapping(self, start: date, end: date) -> List[Any]:
+        low = bisect.bisect_left(self._starts, start - self._longest)
+        high = bisect.bisect_right(self._starts, end)
+
+        return [
+            item
+            for entry_start, entry_end, item in self._entries[low:high]
+            if entry_end >= start
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Coverage:
+    def __init__(self):
+        """
+        Sorted, merged, inclusive date ranges that have already been fetched.
+        """
+        self.ranges: List[Tuple[date, date]] = []
+
+    def gaps(self, start: date, end: date) -> List[Tuple[date, date]]:
+        """
+        Sub-ranges of [start, end] that are not covered yet.
+        """
+        gaps = []
+        cursor = start
+
+        for covered_start, covered_end in self.ranges:
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - ONE_DAY))
+            cursor = max(cursor, covered_end + ONE_DAY)
+            if cursor > end:
+                return gaps
+
+        if cursor <= end:
+            gaps.append((cursor, end))
+
+        return gaps
+
+    def add(self, start: date, end: date):
+        merged = []
+
+        for covered_start, covered_end in self.ranges:
+            # Adjacent ranges are merged too, [1, 3] and [4, 6] become [1, 6].
+            if covered_end + ONE_DAY < start or covered_start - ONE_DAY > end:
+                merged.append((covered_start, covered_end))
+            else:
+                start = min(start, covered_start)
+                end = max(end, covered_end)
+
+        merged.append((start, end))
+        merged.sort()
+        self.ranges = merged
+
+
+class WhosOutCache:
+    def __init__(
+        self,
+        timeOff,
+        includeHourly: Optional[bool] = None,
+        includePrivate: Optional[bool] = None,
+        includePending: Optional[bool] = None,
+        max_age: Optional[float] = 3600.0,
+    ):
+        """
+        Local interval index over TimeOff.get_whos_out_of_office responses.
+
+        Queried ranges are checked against the ranges already fetched, only the uncovered
+        gaps are requested from the API, and answers come from an interval index without
+        network calls once a range is covered.
+
+        Args:
+            timeOff (TimeOff): TimeOff endpoint used to fetch missing ranges.
+            includeHourly, includePrivate, includePending: Passed to get_whos_out_of_office.
+            max_age (float, optional): Seconds after which everything is fetched again. Default is 3600, None never expires.
+
+        Example:
+            whosout = bob.time_off.whos_out_cache()
+            out_today = whosout.out_on(date.today())
+            out_next_week = whosout.out_between("2024-06-03", "2024-06-07")
+        """
+        require_sync(timeOff.client, "WhosOutCache")
+
+        self.timeOff = timeOff
+        self.includeHourly = includeHourly
+        self.includePrivate = includePrivate
+        self.includePending = includePending
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """
+        Drop every cached entry and covered range.
+        """
+        self.coverage = Coverage()
+        self.index = IntervalIndex()
+        self._keys = set()
+        self._created_at = time.monotonic()
+
+    def out_on(self, day: DateLike) -> List[dict]:
+        """
+        Who is out on day.
+        """
+        return self.out_between(day, day)
+
+    def out_between(self, fromDate: DateLike, toDate: DateLike) -> List[dict]:
+        """
+        Who is out at any point between fromDate and toDate, both inclusive.
+        """
+        start, end = as_date(fromDate), as_date(toDate)
+
+        with self._lock:
+            self._ensure(start, end)
+            return self.index.overlapping(start, end)
+
+    def for_employee(
+        self, employeeId: str, fromDate: DateLike, toDate: DateLike
+    ) -> List[dict]:
+        """
+        employeeId's time off overlapping fromDate to toDate.
+        """
+        return [
+            out
+            for out in self.out_between(fromDate, toDate)
+            if str(out.get("employeeId")) == str(employeeId)
+        ]
+
+    def _ensure(self, start: date, end: date):
+        if (
+            self.max_age is not None
+            and time.monotonic() - self._created_at >= self.max_age
+        ):
+            self.clear()
+
+        for gap_start, gap_end in self.coverage.gaps(start, end):
+            response = self.timeOff.get_whos_out_of_office(
+                gap_start.isoformat(),
+                gap_end.isoformat(),
+                includeHourly=self.includeHourly,
+                includePrivate=self.includePrivate,
+                includePending=self.includePending,
+            )
+
+            keys = set()
+
+            for out in response.get("outs", []):
+                keys.add(self._add(out))
+
+            # Checked against earlier fetches only, one response has no duplicates.
+            self._keys |= keys
+
+            self.coverage.add(gap_start, gap_end)
+
+    def _add(self, out: dict) -> Hashable:
+        # Entries spanning a gap boundary are returned by both neighbouring fetches.
+        key: Hashable = out.get("requestId") or tuple(
+            out.get(field)
+            for field in (
+                "employeeId",
+                "policyTypeDisplayName",
+                "startDate",
+                "startPortion",
+                "endDate",
+                "endPortion",
+                "hours",
+                "minutes",
+            )
+        )
+
+        if key not in self._keys:
+            self.index.add(as_date(out["startDate"]), as_date(out["endDate"]), out)
+
+        return key
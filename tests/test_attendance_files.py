@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pybob_sdk.v1.attendance_files import java_formatter, timestamp_normaliser
+
+LONDON_SUMMER = timezone(timedelta(hours=1))
+INDIA = timezone(timedelta(hours=5, minutes=30))
+NEW_YORK = timezone(timedelta(hours=-4))
+
+MOMENT = datetime(2024, 6, 3, 9, 5, 7, 123456, tzinfo=LONDON_SUMMER)
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("yyyy-MM-dd'T'HH:mm", "2024-06-03T09:05"),
+        ("yyyy-MM-dd'T'HH:mm:ss.SSSXXX", "2024-06-03T09:05:07.123+01:00"),
+        ("dd/MM/yy HH:mm:ss", "03/06/24 09:05:07"),
+        ("d-M-yyyy h:m a", "3-6-2024 9:5 AM"),
+        ("dd-MMM-yyyy", "03-Jun-2024"),
+        ("d MMMM yyyy", "3 June 2024"),
+        ("MMMMM", "J"),
+        ("HH:mm 'o''clock'", "09:05 o'clock"),
+        ("''HH''", "'09'"),
+        ("HH:mmX", "09:05+01"),
+        ("HH:mmXX", "09:05+0100"),
+        ("HH:mmXXX", "09:05+01:00"),
+        ("HH:mmZ", "09:05+0100"),
+        ("HH:mmZZZZ", "09:05GMT+01:00"),
+        ("HH:mmZZZZZ", "09:05+01:00"),
+    ],
+)
+def test_java_formatter(pattern, expected):
+    assert java_formatter(pattern)(MOMENT) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, tz, expected",
+    [
+        ("X", timezone.utc, "Z"),
+        ("XXX", timezone.utc, "Z"),
+        ("Z", timezone.utc, "+0000"),
+        ("ZZZZ", timezone.utc, "GMT"),
+        ("ZZZZZ", timezone.utc, "Z"),
+        ("X", INDIA, "+0530"),
+        ("XXX", INDIA, "+05:30"),
+        ("X", NEW_YORK, "-04"),
+        ("XX", NEW_YORK, "-0400"),
+    ],
+)
+def test_java_formatter_offsets(pattern, tz, expected):
+    assert java_formatter(pattern)(MOMENT.replace(tzinfo=tz)) == expected
+
+
+@pytest.mark.parametrize("pattern", ["EEE dd", "MMMMMM", "XXXXXX", "yyyy-MM-dd VV"])
+def test_java_formatter_refuses_unsupported_patterns(pattern):
+    with pytest.raises(ValueError):
+        java_formatter(pattern)
+
+
+def test_offset_of_naive_timestamp_is_refused():
+    normalise = timestamp_normaliser("yyyy-MM-dd'T'HH:mmXXX")
+
+    with pytest.raises(ValueError):
+        normalise("2024-06-03T09:05")
+
+    assert normalise("2024-06-03T09:05Z") == "2024-06-03T09:05Z"
+
+
+def test_source_timezone_applies_to_naive_timestamps():
+    normalise = timestamp_normaliser(
+        "yyyy-MM-dd'T'HH:mmXXX", "%d/%m/%Y %H:%M", sourceTimezone=LONDON_SUMMER
+    )
+
+    assert normalise("03/06/2024 09:05") == "2024-06-03T09:05+01:00"
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+
+from pybob_sdk.v1.csv_rows import iter_typed_rows, parse_currency, parse_number
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1234.50", Decimal("1234.50")),
+        ("1,234.50", Decimal("1234.50")),
+        ("£1,234.50", Decimal("1234.50")),
+        ("1,234.50 GBP", Decimal("1234.50")),
+        ("USD 7", Decimal("7")),
+        ("-£1,234.50", Decimal("-1234.50")),
+        ("£-1,234.50", Decimal("-1234.50")),
+        ("- £5", Decimal("-5")),
+        ("(1,234.50)", Decimal("-1234.50")),
+        ("(£1,234.50)", Decimal("-1234.50")),
+    ],
+)
+def test_parse_currency(value, expected):
+    assert parse_currency(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        # Comma decimal amounts are refused rather than misread.
+        "12,50",
+        "1.234,50 €",
+        "1,23,456",
+        "1.234.567",
+        # Signs and parentheses that do not form a single negative amount.
+        "(-5)",
+        "--5",
+        "5-",
+        "1,234.50 GBP)",
+        "GBP",
+    ],
+)
+def test_parse_currency_refuses_ambiguous_amounts(value):
+    with pytest.raises(ValueError):
+        parse_currency(value)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("12", 12), ("-12", -12), ("3.5", 3.5), ("1,234", 1234), ("1,234.5", 1234.5)],
+)
+def test_parse_number(value, expected):
+    assert parse_number(value) == expected
+
+
+@pytest.mark.parametrize("value", ["1,5", "12,50", "1,23,456"])
+def test_parse_number_refuses_comma_decimals(value):
+    with pytest.raises(ValueError):
+        parse_number(value)
+
+
+def test_iter_typed_rows_keeps_unparsed_cells_as_text():
+    lines = ["amount,count\n", '"12,50","1,5"\n', '"(1,234.50)",3\n']
+    types = {"amount": "currency", "count": "number"}
+
+    assert list(iter_typed_rows(lines, types)) == [
+        {"amount": "12,50", "count": "1,5"},
+        {"amount": Decimal("-1234.50"), "count": 3},
+    ]
+
+    with pytest.raises(ValueError):
+        list(iter_typed_rows(lines, types, strict=True))
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Importing Bob took about 260 ms before endpoints, pydantic and requests were
+# imported lazily, and about 20 ms after. The budget leaves room for slow machines.
+IMPORT_BUDGET_MS = 100
+
+HEAVY_MODULES = ("requests", "pydantic")
+
+
+def import_bob():
+    """
+    Import Bob in a fresh interpreter with -X importtime.
+
+    Returns the heavy modules loaded by the import and the cumulative import time in
+    milliseconds of the modules it imported.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; from pybob_sdk import Bob; "
+            f"print(sorted(m for m in sys.modules if m.split('.')[0] in {HEAVY_MODULES!r}))",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Top level entries (those not nested under another import) after site, which is
+    # imported at startup, are the imports made by the statement itself.
+    cumulative_us, after_site = 0, False
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+
+        if name.startswith("  "):
+            continue
+        if after_site:
+            cumulative_us += int(cumulative)
+        after_site = after_site or name.strip() == "site"
+
+    return result.stdout.strip(), cumulative_us / 1000
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded, _ = import_bob()
+
+    assert loaded == "[]"
+
+
+def test_import_time_budget():
+    # The best of a few runs, so a busy machine does not fail the budget.
+    elapsed_ms = min(import_bob()[1] for _ in range(3))
+
+    assert elapsed_ms < IMPORT_BUDGET_MS, f"importing Bob took {elapsed_ms:.1f} ms"
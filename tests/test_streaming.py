@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from pybob_sdk.streaming import iter_json_array
+
+EMPLOYEES = [
+    {"id": str(index), "displayName": "Zoë Ñúñez", "salary": 1234.5 * index}
+    for index in range(20)
+]
+
+
+def chunked(body: bytes, size: int):
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 20])
+def test_elements_survive_any_chunk_boundary(size):
+    # Multi-byte characters and numbers are split across chunks at small sizes.
+    body = json.dumps(
+        {"meta": {"ids": [1, 2]}, "employees": EMPLOYEES, "total": 20}
+    ).encode()
+
+    assert list(iter_json_array(chunked(body, size), "employees")) == EMPLOYEES
+
+
+def test_number_elements_split_across_chunks():
+    chunks = [b'{"employees": [12', b"34, 5", b"6]}"]
+
+    assert list(iter_json_array(chunks, "employees")) == [1234, 56]
+
+
+def test_key_used_as_a_string_value_is_skipped():
+    body = b'{"type": "employees", "employees": [{"id": "1"}]}'
+
+    assert list(iter_json_array(chunked(body, 1), "employees")) == [{"id": "1"}]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b'{"employees" : \n [ ] }'], "employees")) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b'{"error": "Unauthorized"}',
+        b"<html>Bad gateway</html>",
+    ],
+)
+def test_missing_key_raises(body):
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunked(body, 4), "employees"))
+
+
+def test_key_not_holding_an_array_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"employees": null}'], "employees"))
+
+
+def test_truncated_array_raises():
+    chunks = chunked(b'{"employees": [{"id": "1"}, {"id": "2"', 5)
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(chunks, "employees"))
@@ -0,0 +1,126 @@
+from datetime import date
+
+import pytest
+
+from pybob_sdk.v1.whosout import Coverage, IntervalIndex, WhosOutCache
+
+
+def day(number: int) -> date:
+    return date(2024, 6, number)
+
+
+def coverage(*ranges):
+    covered = Coverage()
+    for start, end in ranges:
+        covered.add(day(start), day(end))
+    return covered
+
+
+def days(ranges):
+    return [(start.day, end.day) for start, end in ranges]
+
+
+def test_empty_coverage_is_one_gap():
+    assert days(Coverage().gaps(day(1), day(30))) == [(1, 30)]
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (1, 30, [(1, 4), (11, 14), (21, 30)]),
+        (5, 10, []),
+        (6, 8, []),
+        (3, 6, [(3, 4)]),
+        (8, 16, [(11, 14)]),
+        (12, 13, [(12, 13)]),
+        (14, 15, [(14, 14)]),
+        (18, 25, [(21, 25)]),
+    ],
+)
+def test_gaps_around_covered_ranges(start, end, expected):
+    covered = coverage((5, 10), (15, 20))
+
+    assert days(covered.gaps(day(start), day(end))) == expected
+
+
+@pytest.mark.parametrize(
+    "ranges, expected",
+    [
+        ([(1, 3), (4, 6)], [(1, 6)]),
+        ([(4, 6), (1, 3)], [(1, 6)]),
+        ([(1, 3), (5, 6)], [(1, 3), (5, 6)]),
+        ([(1, 10), (3, 4)], [(1, 10)]),
+        ([(1, 3), (7, 9), (2, 8)], [(1, 9)]),
+        ([(10, 12), (1, 2), (5, 6)], [(1, 2), (5, 6), (10, 12)]),
+    ],
+)
+def test_add_merges_overlapping_and_adjacent_ranges(ranges, expected):
+    assert days(coverage(*ranges).ranges) == expected
+
+
+def test_added_gaps_leave_nothing_uncovered():
+    covered = coverage((5, 10), (15, 20))
+
+    for start, end in covered.gaps(day(1), day(30)):
+        covered.add(start, end)
+
+    assert covered.gaps(day(1), day(30)) == []
+    assert days(covered.ranges) == [(1, 30)]
+
+
+def test_interval_index_overlaps_are_inclusive():
+    index = IntervalIndex()
+    index.add(day(1), day(30), "long")
+    index.add(day(3), day(3), "single day")
+    index.add(day(10), day(12), "short")
+
+    assert index.overlapping(day(3), day(3)) == ["long", "single day"]
+    assert index.overlapping(day(12), day(20)) == ["long", "short"]
+    assert index.overlapping(day(4), day(9)) == ["long"]
+    assert index.overlapping(date(2024, 7, 1), date(2024, 7, 2)) == []
+
+
+class FakeTimeOff:
+    def __init__(self, outs):
+        self.client = self
+        self.outs = outs
+        self.calls = []
+
+    def get(self, *args, **kwargs):
+        raise AssertionError("WhosOutCache reads through get_whos_out_of_office")
+
+    def get_whos_out_of_office(self, fromDate, toDate, **kwargs):
+        self.calls.append((fromDate, toDate))
+        return {"outs": self.outs}
+
+
+def test_cache_keeps_half_days_and_drops_entries_seen_twice():
+    half_day = {
+        "employeeId": "1",
+        "policyTypeDisplayName": "Holiday",
+        "startDate": "2024-06-03",
+        "endDate": "2024-06-03",
+    }
+    outs = [
+        {**half_day, "startPortion": "morning", "endPortion": "morning"},
+        {**half_day, "startPortion": "afternoon", "endPortion": "afternoon"},
+        {**half_day, "policyTypeDisplayName": "Hourly", "hours": 1},
+        {**half_day, "policyTypeDisplayName": "Hourly", "hours": 1},
+        {
+            "requestId": 7,
+            "employeeId": "2",
+            "startDate": "2024-06-01",
+            "endDate": "2024-06-10",
+        },
+    ]
+    timeOff = FakeTimeOff(outs)
+    cache = WhosOutCache(timeOff)
+
+    assert len(cache.out_on("2024-06-03")) == 5
+    # Both new gaps return the same entries again, none of them is added twice.
+    assert len(cache.out_between("2024-06-01", "2024-06-10")) == 5
+    assert timeOff.calls == [
+        ("2024-06-03", "2024-06-03"),
+        ("2024-06-01", "2024-06-02"),
+        ("2024-06-04", "2024-06-10"),
+    ]